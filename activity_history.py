@@ -0,0 +1,101 @@
+import json
+import os
+import time
+
+class ActivityHistory:
+    BLOCK_SIZE = 65536
+    
+    def __init__(self, path="enhanced_kanban_activity.log", max_bytes=2_000_000, backups=10):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.rotations = 0
+        self.file = None
+    
+    def open(self):
+        if self.file is None:
+            self.file = open(self.path, 'a', encoding='utf-8')
+        return self.file
+    
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+    
+    def append(self, message, timestamp=None):
+        record = {'ts': time.time() if timestamp is None else timestamp, 'message': message}
+        f = self.open()
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        if f.tell() >= self.max_bytes:
+            self.rotate()
+        return record
+    
+    def backup_path(self, number):
+        return self.path if number == 0 else f"{self.path}.{number}"
+    
+    def rotate(self):
+        self.close()
+        oldest = self.backup_path(self.backups)
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for number in range(self.backups - 1, -1, -1):
+            source = self.backup_path(number)
+            if os.path.exists(source):
+                os.replace(source, self.backup_path(number + 1))
+        self.rotations += 1
+    
+    def start(self):
+        return (self.rotations, 0, None)
+    
+    def read_page(self, cursor=None, limit=200):
+        rotations, number, end = cursor or self.start()
+        number += self.rotations - rotations
+        if self.file is not None:
+            self.file.flush()
+        
+        entries = []
+        while len(entries) < limit and number <= self.backups:
+            path = self.backup_path(number)
+            if not os.path.exists(path):
+                if number == 0:
+                    number, end = 1, None
+                    continue
+                break
+            
+            lines, end = self.read_lines_backwards(path, end, limit - len(entries))
+            for line in lines:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+            if end == 0:
+                number, end = number + 1, None
+        
+        if number > self.backups or not os.path.exists(self.backup_path(number)):
+            return entries, None
+        return entries, (self.rotations, number, end)
+    
+    def read_lines_backwards(self, path, end, limit):
+        lines = []
+        with open(path, 'rb') as f:
+            if end is None:
+                f.seek(0, os.SEEK_END)
+                end = f.tell()
+            position = stop = end
+            chunk = b""
+            while len(lines) < limit and stop > 0:
+                newline = chunk.rfind(b"\n", 0, max(0, len(chunk) - 1))
+                if newline < 0 and position > 0:
+                    size = min(self.BLOCK_SIZE, position)
+                    position -= size
+                    f.seek(position)
+                    chunk = f.read(size) + chunk
+                    continue
+                
+                line = chunk[newline + 1:]
+                chunk = chunk[:newline + 1]
+                stop = position + len(chunk)
+                if line.strip():
+                    lines.append(line.decode('utf-8', errors='replace'))
+        return lines, stop
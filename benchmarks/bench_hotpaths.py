@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+class NoDisplay(Exception):
+    pass
+
+def start_xvfb(display=":99"):
+    if os.environ.get('DISPLAY'):
+        return None
+    if shutil.which('Xvfb') is None:
+        raise NoDisplay("pas de $DISPLAY et Xvfb introuvable: lancez sous xvfb-run ou installez Xvfb")
+    
+    process = subprocess.Popen(['Xvfb', display, '-screen', '0', '1920x1080x24', '-nolisten', 'tcp'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ['DISPLAY'] = display
+    time.sleep(0.5)
+    return process
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def summarize(timings):
+    timings = sorted(timings)
+    return {
+        'n': len(timings),
+        'mean_ms': statistics.fmean(timings) * 1000,
+        'p50_ms': timings[len(timings) // 2] * 1000,
+        'p95_ms': timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000,
+        'max_ms': timings[-1] * 1000
+    }
+
+def timed(root, func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        root.update_idletasks()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def run(args, directory):
+    import tkinter as tk
+    from tkinter import filedialog
+    
+    import main
+    from synthetic import generate_board
+    
+    # Le chargement passe par le dialogue de fichier et se termine par une boîte d'information
+    main.messagebox.showinfo = lambda *a, **k: None
+    board_path = os.path.join(directory, "board" + args.format)
+    filedialog.askopenfilename = lambda **kwargs: board_path
+    
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise NoDisplay(f"affichage inaccessible: {e}") from e
+    root.geometry("1600x900")
+    app = main.EnhancedKanbanApp(root, virtual=args.virtual, renderer=args.renderer,
+                                 history_path=os.path.join(directory, "activity.log"),
+                                 board_path=board_path, journal=False)
+    root.update()
+    
+    def fresh_board():
+        return generate_board(args.columns, args.cards, args.description_length, args.assignees, args.seed)
+    
+    results = {}
+    app.board = fresh_board()
+    
+    results['refresh_board'] = summarize(timed(root, app.refresh_board, args.repeat))
+    
+    column = app.columns[-1]
+    def create_column():
+        col_frame = app.create_column(column, len(app.column_frames), app.col_width)
+        root.update_idletasks()
+        app.column_frames.remove(col_frame)
+        col_frame.destroy()
+    results['create_column'] = summarize(timed(root, create_column, args.repeat))
+    app.refresh_board()
+    
+    rng = random.Random(args.seed)
+    card_ids = list(app.board.index)
+    def move_card():
+        card_id = rng.choice(card_ids)
+        from_index = app.board.column_index(app.board.column_of(card_id))
+        to_index = rng.choice([i for i in range(1, len(app.columns)) if i != from_index])
+        app.move_card(card_id, to_index)
+    results['move_card'] = summarize(timed(root, move_card, args.moves))
+    
+    def save_board():
+        app.changed()
+        app.save_board(quiet=True)
+        app.saver.join()
+        app.poll_saves()
+    results['save_board'] = summarize(timed(root, save_board, args.repeat))
+    
+    def load_board():
+        app.load_board()
+        while app.loader is not None:
+            root.update()
+    results['load_board'] = summarize(timed(root, load_board, args.repeat))
+    
+    root.update()
+    points = []
+    for _ in range(args.hits):
+        col_frame = rng.choice(app.column_frames)
+        canvas = col_frame.cards_canvas
+        points.append((canvas.winfo_rootx() + rng.randrange(max(1, canvas.winfo_width())),
+                       canvas.winfo_rooty() + rng.randrange(max(1, canvas.winfo_height()))))
+    
+    geometry = main.DropGeometry(app)
+    start = time.perf_counter()
+    geometry.locate(*points[0])
+    cold = time.perf_counter() - start
+    warm = []
+    for x, y in points:
+        start = time.perf_counter()
+        geometry.locate(x, y)
+        warm.append(time.perf_counter() - start)
+    results['find_drop_position_cold'] = summarize([cold])
+    results['find_drop_position'] = summarize(warm)
+    
+    counter = iter(range(10 ** 9))
+    results['activity_add'] = summarize(timed(root, lambda: app.activity_panel.add_activity(
+        f"Activité de test {next(counter)}"), args.activities))
+    results['activity_refresh'] = summarize(timed(root, app.activity_panel.refresh, args.repeat))
+    
+    root.destroy()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Chronométrage des chemins critiques sur un tableau synthétique")
+    parser.add_argument('--columns', type=int, default=5)
+    parser.add_argument('--cards', type=int, default=200, help="cartes par colonne")
+    parser.add_argument('--description-length', type=int, default=80)
+    parser.add_argument('--assignees', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--moves', type=int, default=50)
+    parser.add_argument('--hits', type=int, default=1000)
+    parser.add_argument('--activities', type=int, default=500)
+    parser.add_argument('--virtual', action='store_true')
+    parser.add_argument('--renderer', choices=['widgets', 'canvas'], default='widgets')
+    parser.add_argument('--format', choices=['.json', '.kbs'], default='.json')
+    parser.add_argument('--output', metavar='FICHIER', help="écrit les résultats JSON dans ce fichier")
+    args = parser.parse_args()
+    
+    report = {
+        'revision': git_revision(),
+        'date': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': vars(args)
+    }
+    xvfb = None
+    try:
+        xvfb = start_xvfb()
+        with tempfile.TemporaryDirectory() as directory:
+            report['results'] = run(args, directory)
+    except NoDisplay as e:
+        # Sans affichage la suite est ignorée, pas en échec: le rapport le signale
+        print(f"Chronométrage ignoré: {e}", file=sys.stderr)
+        report['skipped'] = str(e)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+    
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    print(text)
+
+if __name__ == "__main__":
+    main()
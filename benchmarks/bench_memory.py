@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board_model import KanbanCard
+from synthetic import generate_board
+
+class LegacyKanbanCard:
+    def __init__(self, title, description="", assigned_to="", color="#ffffff"):
+        self.title = title
+        self.description = description
+        self.assigned_to = assigned_to
+        self.color = color
+        self.id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.avatar_color = self.generate_avatar_color(assigned_to)
+    
+    def generate_avatar_color(self, name):
+        if not name:
+            return "#cccccc"
+        
+        colors = [
+            "#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FECA57",
+            "#FF9FF3", "#54A0FF", "#5F27CD", "#00D2D3", "#FF9F43",
+            "#FC427B", "#26DE81", "#2D98DA", "#A55EEA", "#FD79A8"
+        ]
+        index = sum(ord(c) for c in name) % len(colors)
+        return colors[index]
+
+def card_rows(board):
+    for column in board.columns:
+        for card in column.cards:
+            # Chaque valeur est une nouvelle chaîne, comme après un json.load
+            yield (card.title, card.description, "".join(card.assigned_to), "".join(card.color))
+
+def measure(card_class, board):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cards = [card_class(title, description, assigned_to, color)
+             for title, description, assigned_to, color in card_rows(board)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(cards)
+
+def main():
+    parser = argparse.ArgumentParser(description="Mémoire par carte: KanbanCard compact vs ancien format")
+    parser.add_argument('--cards', type=int, default=200000)
+    parser.add_argument('--assignees', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    # Tableau source construit avant les mesures: seules les cartes copiées sont comptées
+    board = generate_board(1, args.cards, 0, args.assignees, args.seed)
+    legacy = measure(LegacyKanbanCard, board)
+    compact = measure(KanbanCard, board)
+    
+    print(f"{args.cards} cartes, {args.assignees} assignés")
+    print(f"avant  (dict)      : {legacy:8.1f} octets/carte")
+    print(f"après  (__slots__) : {compact:8.1f} octets/carte")
+    print(f"gain               : {100 * (1 - compact / legacy):8.1f} %")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from persistence import (board_from_dict, read_binary, read_json, snapshot_board, snapshot_to_dict,
+                         write_binary_atomic, write_json_atomic)
+from synthetic import generate_board
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Instantané JSON vs format binaire compact: taille, sauvegarde, chargement")
+    parser.add_argument('--cards', type=int, default=100000)
+    parser.add_argument('--columns', type=int, default=5)
+    parser.add_argument('--description-length', type=int, default=30)
+    parser.add_argument('--assignees', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    board = generate_board(args.columns, args.cards // args.columns, args.description_length, args.assignees,
+                           args.seed)
+    activities = [f"[12:00:{i % 60:02d}] Activité {i}" for i in range(1000)]
+    
+    formats = [
+        ("JSON (indent=2)", ".json", lambda path, data: write_json_atomic(path, data), read_json),
+        ("binaire", ".kbs", lambda path, data: write_binary_atomic(path, data, compress=False), read_binary),
+        ("binaire + zlib", ".kbs", lambda path, data: write_binary_atomic(path, data), read_binary),
+    ]
+    
+    print(f"{args.cards} cartes, {args.assignees} assignés, meilleur de {args.repeat}")
+    print(f"{'format':<18}{'taille':>12}{'sauvegarde':>14}{'chargement':>14}")
+    with tempfile.TemporaryDirectory() as directory:
+        for label, extension, write, read in formats:
+            path = os.path.join(directory, "board" + extension)
+            save = best_of(args.repeat, lambda: write(path, snapshot_to_dict(snapshot_board(board, activities))))
+            load = best_of(args.repeat, lambda: board_from_dict(read(path)))
+            size = os.path.getsize(path)
+            print(f"{label:<18}{size / 1024:>9.0f} Ko{save * 1000:>11.0f} ms{load * 1000:>11.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import random
+
+from board_model import BoardModel, KanbanCard, KanbanColumn
+
+PRESET_COLORS = ['#ffffff', '#ffcccb', '#ffffcc', '#ccffcc', '#ccccff', '#ffccff', '#ffd700']
+WORDS = ("api", "backend", "interface", "correctif", "révision", "migration", "cache", "tests",
+         "documentation", "performance", "sécurité", "déploiement", "client", "rapport", "données")
+
+def generate_board(columns=5, cards_per_column=200, description_length=80, assignees=20, seed=42):
+    rng = random.Random(seed)
+    names = [f"Membre {i}" for i in range(assignees)] + [""]
+    
+    column_names = [name for name, _ in BoardModel.DEFAULT_COLUMNS]
+    board = BoardModel()
+    for col_index in range(columns):
+        name = column_names[col_index] if col_index < len(column_names) else f"Colonne {col_index + 1}"
+        column = board.add_column(KanbanColumn(name, col_index == 0))
+        for i in range(cards_per_column):
+            description = ""
+            while len(description) < description_length:
+                description += rng.choice(WORDS) + " "
+            card = KanbanCard(f"{rng.choice(WORDS).capitalize()} {col_index}-{i}",
+                              description[:description_length].rstrip(),
+                              rng.choice(names), rng.choice(PRESET_COLORS))
+            board.add_card(card, column)
+    return board
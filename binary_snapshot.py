@@ -0,0 +1,154 @@
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+
+MAGIC = b"KBS1"
+FLAG_ZLIB = 0x01
+HEADER = struct.Struct("<4sB")
+BLOCK = struct.Struct("<I")
+
+def int_block(values, typecode='I'):
+    values = array(typecode, values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+def read_ints(block, typecode='I'):
+    values = array(typecode)
+    values.frombytes(block)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+def string_blocks(strings):
+    # Longueurs en points de code: le texte décodé se découpe ensuite par simples tranches
+    return int_block(len(s) for s in strings), "".join(strings).encode('utf-8', 'surrogatepass')
+
+def read_strings(lengths_block, text_block):
+    text = text_block.decode('utf-8', 'surrogatepass')
+    ends = list(accumulate(read_ints(lengths_block)))
+    return [text[start:end] for start, end in zip([0] + ends, ends)]
+
+class StringTable:
+    def __init__(self):
+        self.strings = []
+        self.refs = {}
+    
+    def ref(self, value):
+        ref = self.refs.get(value)
+        if ref is None:
+            ref = self.refs[value] = len(self.strings)
+            self.strings.append(value)
+        return ref
+
+def encode_snapshot(data, compress=True):
+    table = StringTable()
+    column_rows, card_refs = [], []
+    titles, descriptions, ids, ranks = [], [], [], []
+    
+    for col_data in data.get('columns', []):
+        cards = col_data.get('cards', [])
+        column_rows.extend((table.ref(col_data['name']), int(col_data.get('is_backlog', False)), len(cards)))
+        for card in cards:
+            card_refs.append(table.ref(card.get('assigned_to', '')))
+            card_refs.append(table.ref(card.get('color', '#ffffff')))
+            titles.append(card['title'])
+            descriptions.append(card.get('description', ''))
+            ids.append(card.get('id') or '')
+            ranks.append(card.get('rank') or '')
+    
+    activities = data.get('activities')
+    meta = (
+        table.ref(data['saved_at']) if 'saved_at' in data else -1,
+        data['journal_seq'] if 'journal_seq' in data else -1,
+        1 if activities is not None else 0
+    )
+    
+    blocks = [
+        int_block(meta, 'q'),
+        *string_blocks(table.strings),
+        int_block(column_rows),
+        int_block(card_refs),
+        *string_blocks(titles),
+        *string_blocks(descriptions),
+        *string_blocks(ids),
+        *string_blocks(activities or []),
+    ]
+    # Blocs facultatifs en fin de corps: les instantanés sans rangs restent lisibles tels quels
+    if any(ranks):
+        blocks.extend(string_blocks(ranks))
+    body = b"".join(BLOCK.pack(len(block)) + block for block in blocks)
+    
+    flags = 0
+    if compress:
+        body = zlib.compress(body, 1)
+        flags |= FLAG_ZLIB
+    return HEADER.pack(MAGIC, flags) + body
+
+def split_blocks(body):
+    blocks = []
+    position = 0
+    while position < len(body):
+        if position + BLOCK.size > len(body):
+            raise ValueError("instantané binaire tronqué")
+        (size,) = BLOCK.unpack_from(body, position)
+        position += BLOCK.size
+        blocks.append(body[position:position + size])
+        position += size
+    if position != len(body):
+        raise ValueError("instantané binaire tronqué")
+    return blocks
+
+def decode_snapshot(payload):
+    if len(payload) < HEADER.size:
+        raise ValueError("instantané binaire tronqué")
+    magic, flags = HEADER.unpack_from(payload)
+    if magic != MAGIC:
+        raise ValueError("format d'instantané binaire inconnu")
+    body = payload[HEADER.size:]
+    if flags & FLAG_ZLIB:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as e:
+            raise ValueError(f"instantané binaire corrompu: {e}") from e
+    
+    blocks = split_blocks(body)
+    if len(blocks) not in (13, 15):
+        raise ValueError("instantané binaire incomplet")
+    saved_at_ref, journal_seq, has_activities = read_ints(blocks[0], 'q')
+    strings = read_strings(blocks[1], blocks[2])
+    column_rows = read_ints(blocks[3])
+    card_refs = read_ints(blocks[4])
+    titles = read_strings(blocks[5], blocks[6])
+    descriptions = read_strings(blocks[7], blocks[8])
+    ids = read_strings(blocks[9], blocks[10])
+    activities = read_strings(blocks[11], blocks[12]) if has_activities else None
+    ranks = read_strings(blocks[13], blocks[14]) if len(blocks) == 15 else None
+    
+    columns = []
+    card_index = 0
+    for row in range(0, len(column_rows), 3):
+        name_ref, is_backlog, card_count = column_rows[row:row + 3]
+        cards = []
+        for i in range(card_index, card_index + card_count):
+            cards.append({
+                'title': titles[i],
+                'description': descriptions[i],
+                'assigned_to': strings[card_refs[2 * i]],
+                'color': strings[card_refs[2 * i + 1]],
+                'id': ids[i],
+                'rank': ranks[i] or None if ranks else None
+            })
+        card_index += card_count
+        columns.append({'name': strings[name_ref], 'is_backlog': bool(is_backlog), 'cards': cards})
+    
+    data = {'columns': columns}
+    if has_activities:
+        data['activities'] = activities
+    if saved_at_ref >= 0:
+        data['saved_at'] = strings[saved_at_ref]
+    if journal_seq >= 0:
+        data['journal_seq'] = journal_seq
+    return data
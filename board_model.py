@@ -0,0 +1,334 @@
+import sys
+import uuid
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from operator import attrgetter
+
+from rank_keys import key_between, keys_between
+from search_index import SearchIndex, card_tokens
+
+def new_card_id():
+    return uuid.uuid4().hex
+
+AVATAR_COLORS = (
+    "#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FECA57",
+    "#FF9FF3", "#54A0FF", "#5F27CD", "#00D2D3", "#FF9F43",
+    "#FC427B", "#26DE81", "#2D98DA", "#A55EEA", "#FD79A8"
+)
+
+@lru_cache(maxsize=4096)
+def avatar_color(name):
+    if not name:
+        return "#cccccc"
+    
+    index = sum(ord(c) for c in name) % len(AVATAR_COLORS)
+    return AVATAR_COLORS[index]
+
+@lru_cache(maxsize=4096)
+def avatar_initials(name):
+    if not name:
+        return "?"
+    
+    parts = name.strip().split()
+    if len(parts) == 1:
+        return parts[0][:2].upper()
+    else:
+        return (parts[0][0] + parts[-1][0]).upper()
+
+RANK = attrgetter('rank')
+
+class KanbanCard:
+    __slots__ = ('title', 'description', '_assigned_to', '_color', 'id', 'rank')
+    
+    def __init__(self, title, description="", assigned_to="", color="#ffffff", card_id=None, rank=None):
+        self.title = title
+        self.description = description
+        self.assigned_to = assigned_to
+        self.color = color
+        self.id = card_id or new_card_id()
+        self.rank = rank
+    
+    @property
+    def assigned_to(self):
+        return self._assigned_to
+    
+    @assigned_to.setter
+    def assigned_to(self, value):
+        self._assigned_to = sys.intern(value or "")
+    
+    @property
+    def color(self):
+        return self._color
+    
+    @color.setter
+    def color(self, value):
+        self._color = sys.intern(value or "#ffffff")
+    
+    @property
+    def avatar_color(self):
+        return avatar_color(self._assigned_to)
+    
+    def generate_avatar_color(self, name):
+        return avatar_color(name)
+    
+    def to_dict(self):
+        return {
+            'title': self.title,
+            'description': self.description,
+            'assigned_to': self.assigned_to,
+            'color': self.color,
+            'id': self.id,
+            'rank': self.rank
+        }
+    
+    @classmethod
+    def from_dict(cls, card_data):
+        return cls(
+            title=card_data['title'],
+            description=card_data.get('description', ''),
+            assigned_to=card_data.get('assigned_to', ''),
+            color=card_data.get('color', '#ffffff'),
+            card_id=card_data.get('id'),
+            rank=card_data.get('rank')
+        )
+
+class KanbanColumn:
+    __slots__ = ('name', 'cards', 'is_backlog')
+    
+    def __init__(self, name, is_backlog=False):
+        self.name = sys.intern(name)
+        self.cards = []
+        self.is_backlog = is_backlog
+
+class BoardModel:
+    DEFAULT_COLUMNS = [
+        ("📋 Backlog", True),
+        ("📝 À faire", False),
+        ("⚡ En cours", False),
+        ("🔍 Révision", False),
+        ("✅ Terminé", False)
+    ]
+    
+    def __init__(self, columns=None):
+        self.columns = []
+        self.index = {}
+        self.search_index = None
+        self.assignees = {}
+        self.assignee_counts = {}
+        for column in columns or []:
+            self.add_column(column)
+    
+    @classmethod
+    def default(cls):
+        return cls([KanbanColumn(name, is_backlog) for name, is_backlog in cls.DEFAULT_COLUMNS])
+    
+    def __len__(self):
+        return len(self.index)
+    
+    def __contains__(self, card_id):
+        return card_id in self.index
+    
+    def register(self, column, card, tokens=None):
+        if card.id in self.index:
+            card.id = new_card_id()
+        self.index[card.id] = (column, card)
+        self.index_assignee(column, card, 1)
+        if self.search_index is not None:
+            self.search_index.add(card, tokens)
+    
+    def index_assignee(self, column, card, delta):
+        name = card.assigned_to
+        cards = self.assignees.setdefault(name, {})
+        if delta > 0:
+            cards[card.id] = card
+        else:
+            cards.pop(card.id, None)
+            if not cards:
+                del self.assignees[name]
+        
+        key = (column, name)
+        count = self.assignee_counts.get(key, 0) + delta
+        if count:
+            self.assignee_counts[key] = count
+        else:
+            self.assignee_counts.pop(key, None)
+    
+    def add_column(self, column):
+        self.columns.append(column)
+        self.rank_cards(column)
+        for card in column.cards:
+            self.register(column, card)
+        return column
+    
+    def rank_cards(self, column):
+        # Tableaux d'avant les rangs (ou clés incohérentes): on renumérote une fois, dans l'ordre de la liste
+        cards = column.cards
+        previous = None
+        for card in cards:
+            if card.rank is None or (previous is not None and card.rank <= previous):
+                break
+            previous = card.rank
+        else:
+            return False
+        
+        for card, rank in zip(cards, keys_between(None, None, len(cards))):
+            card.rank = rank
+        return True
+    
+    def place(self, column, card):
+        cards = column.cards
+        if card.rank is None:
+            card.rank = key_between(cards[-1].rank if cards else None, None)
+        if not cards or cards[-1].rank < card.rank:
+            cards.append(card)
+        else:
+            cards.insert(bisect_right(cards, card.rank, key=RANK), card)
+    
+    def unplace(self, column, card):
+        # Colonne triée par rang: recherche dichotomique, puis parcours des rangs égaux jusqu'à la carte
+        cards = column.cards
+        i = bisect_left(cards, card.rank, key=RANK)
+        while i < len(cards) and cards[i] is not card:
+            if cards[i].rank != card.rank:
+                raise ValueError(f"carte absente de la colonne: {card.id}")
+            i += 1
+        if i == len(cards):
+            raise ValueError(f"carte absente de la colonne: {card.id}")
+        del cards[i]
+    
+    def ranks_beside(self, column, anchor, count, before=False, skip=()):
+        # Clés entre anchor et sa vraie voisine dans la colonne complète (cartes masquées comprises)
+        cards = column.cards
+        if before:
+            position = bisect_left(cards, anchor.rank, key=RANK) - 1
+            while position >= 0 and cards[position].id in skip:
+                position -= 1
+            return keys_between(cards[position].rank if position >= 0 else None, anchor.rank, count)
+        
+        position = bisect_right(cards, anchor.rank, key=RANK)
+        while position < len(cards) and cards[position].id in skip:
+            position += 1
+        return keys_between(anchor.rank, cards[position].rank if position < len(cards) else None, count)
+    
+    def backlog(self):
+        for column in self.columns:
+            if column.is_backlog:
+                return column
+        return None
+    
+    def find(self, card_id):
+        return self.index.get(card_id)
+    
+    def cards_of(self, name):
+        return list(self.assignees.get(name, {}).values())
+    
+    def assignee_count(self, name):
+        return len(self.assignees.get(name, ()))
+    
+    def column_assignee_count(self, column, name):
+        return self.assignee_counts.get((column, name), 0)
+    
+    def get_card(self, card_id):
+        return self.index[card_id][1]
+    
+    def column_of(self, card_id):
+        return self.index[card_id][0]
+    
+    def column_index(self, column):
+        for col_index, candidate in enumerate(self.columns):
+            if candidate is column:
+                return col_index
+        raise ValueError(f"colonne inconnue: {column.name}")
+    
+    def add_card(self, card, column=None, tokens=None):
+        if column is None:
+            column = self.backlog()
+            if column is None:
+                raise KeyError("Pas de backlog trouvé")
+        
+        self.register(column, card, tokens)
+        self.place(column, card)
+        return column
+    
+    def update_card(self, card_id, **fields):
+        column, card = self.index[card_id]
+        for name in fields:
+            if name not in ('title', 'description', 'assigned_to', 'color'):
+                raise AttributeError(name)
+        
+        old_tokens = card_tokens(card) if self.search_index is not None else None
+        self.index_assignee(column, card, -1)
+        for name, value in fields.items():
+            setattr(card, name, value)
+        self.index_assignee(column, card, 1)
+        if self.search_index is not None:
+            self.search_index.update(card, old_tokens)
+        return card
+    
+    def delete_card(self, card_id):
+        column, card = self.index.pop(card_id)
+        self.unplace(column, card)
+        self.index_assignee(column, card, -1)
+        if self.search_index is not None:
+            self.search_index.remove(card)
+        return column, card
+    
+    def move_card(self, card_id, to_column, rank=None):
+        from_column, card = self.index[card_id]
+        if from_column is to_column and (rank is None or rank == card.rank):
+            return from_column, card
+        
+        # Seule la clé de la carte déplacée change: sans rang explicite, elle passe en fin de colonne
+        self.unplace(from_column, card)
+        card.rank = rank
+        self.place(to_column, card)
+        if from_column is not to_column:
+            self.index[card_id] = (to_column, card)
+            self.index_assignee(from_column, card, -1)
+            self.index_assignee(to_column, card, 1)
+        return from_column, card
+    
+    def move_column(self, from_index, to_index):
+        self.columns[from_index], self.columns[to_index] = \
+            self.columns[to_index], self.columns[from_index]
+    
+    def enable_search(self):
+        # Index à la demande: le serveur de synchronisation, les rejeux de journal et les tableaux
+        # en cache n'en paient pas la mémoire; une fois construit il suit chaque opération
+        if self.search_index is None:
+            self.search_index = SearchIndex(card for _, card in self.index.values())
+        return self.search_index
+    
+    def disable_search(self):
+        self.search_index = None
+    
+    def search(self, query):
+        return self.enable_search().search(query)
+    
+    def apply(self, op):
+        kind = op['op']
+        if kind == 'add_card':
+            column = self.columns[op['column']]
+            self.add_card(KanbanCard.from_dict(op['card']), column)
+            return [column]
+        if kind == 'update_card':
+            self.update_card(op['id'], **op['fields'])
+            return [self.column_of(op['id'])]
+        if kind == 'delete_card':
+            column, card = self.delete_card(op['id'])
+            return [column]
+        if kind == 'move_card':
+            to_column = self.columns[op['to']]
+            from_column, card = self.move_card(op['id'], to_column, op.get('rank'))
+            return [to_column] if from_column is to_column else [from_column, to_column]
+        if kind == 'move_column':
+            self.move_column(op['from'], op['to'])
+            return []
+        if kind == 'batch':
+            columns = []
+            for sub_op in op['ops']:
+                for column in self.apply(sub_op):
+                    if not any(column is seen for seen in columns):
+                        columns.append(column)
+            return columns
+        raise ValueError(f"opération inconnue: {kind}")
@@ -0,0 +1,113 @@
+import csv
+import json
+import re
+
+from board_model import KanbanCard
+from persistence import write_atomic
+
+CARD_FIELDS = ('title', 'description', 'assigned_to', 'color')
+EXPORT_FIELDS = ('column',) + CARD_FIELDS + ('id',)
+COLOR = re.compile(r"#[0-9a-fA-F]{6}")
+JSONL_EXTENSIONS = ('.jsonl', '.ndjson')
+
+def is_jsonl_path(path):
+    return path.lower().endswith(JSONL_EXTENSIONS)
+
+class ImportReport:
+    MAX_ERRORS = 50
+    
+    def __init__(self):
+        self.imported = 0
+        self.skipped = 0
+        self.errors = []
+    
+    def reject(self, line, message):
+        # Seules les premières erreurs sont gardées: un fichier entièrement invalide ne remplit pas la mémoire
+        self.skipped += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append(f"ligne {line}: {message}")
+
+def card_from_record(record):
+    if not isinstance(record, dict):
+        raise ValueError("objet attendu")
+    
+    values = {}
+    for name in CARD_FIELDS:
+        value = record.get(name)
+        if value is None:
+            value = ""
+        if not isinstance(value, str):
+            raise ValueError(f"{name}: texte attendu")
+        values[name] = value.strip()
+    
+    if not values['title']:
+        raise ValueError("titre manquant")
+    color = values['color'] or "#ffffff"
+    if not COLOR.fullmatch(color):
+        raise ValueError(f"couleur invalide: {color}")
+    # Identifiant toujours neuf: réimporter un export ne doit pas entrer en collision avec le tableau
+    return KanbanCard(values['title'], values['description'], values['assigned_to'], color)
+
+def read_records(f, jsonl):
+    if jsonl:
+        for line, text in enumerate(f, 1):
+            if not text.strip():
+                continue
+            try:
+                yield line, json.loads(text)
+            except ValueError as e:
+                yield line, e
+        return
+    
+    reader = csv.DictReader(f)
+    if reader.fieldnames is None or 'title' not in reader.fieldnames:
+        raise ValueError("colonne 'title' absente de l'en-tête CSV")
+    try:
+        for record in reader:
+            yield reader.line_num, record
+    except csv.Error as e:
+        raise ValueError(f"ligne {reader.line_num}: {e}") from e
+
+def read_cards(path, report):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        for line, record in read_records(f, is_jsonl_path(path)):
+            if isinstance(record, Exception):
+                report.reject(line, f"JSON invalide ({record})")
+                continue
+            try:
+                card = card_from_record(record)
+            except ValueError as e:
+                report.reject(line, str(e))
+                continue
+            yield card
+
+def card_batches(path, report, batch_size=500):
+    batch = []
+    for card in read_cards(path, report):
+        batch.append(card)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def card_rows(columns):
+    for column in columns:
+        for card in column.cards:
+            yield column.name, card.title, card.description, card.assigned_to, card.color, card.id
+
+def write_cards(path, columns):
+    count = sum(len(column.cards) for column in columns)
+    
+    def write(f):
+        if is_jsonl_path(path):
+            for row in card_rows(columns):
+                f.write(json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False) + "\n")
+        else:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(EXPORT_FIELDS)
+            writer.writerows(card_rows(columns))
+    
+    # Sans newline='' les \r\n des champs multilignes seraient retraduits à l'écriture
+    write_atomic(path, write, newline=None if is_jsonl_path(path) else '')
+    return count
@@ -0,0 +1,94 @@
+import functools
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+class HookStats:
+    __slots__ = ('count', 'samples', 'widgets')
+    
+    def __init__(self, window):
+        self.count = 0
+        self.samples = deque(maxlen=window)
+        self.widgets = None
+    
+    def summary(self):
+        samples = sorted(self.samples)
+        if not samples:
+            return {'count': self.count, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0, 'widgets': self.widgets}
+        return {
+            'count': self.count,
+            'p50_ms': samples[len(samples) // 2] * 1000,
+            'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+            'max_ms': samples[-1] * 1000,
+            'widgets': self.widgets
+        }
+
+class Profiler:
+    def __init__(self, window=1000, widget_counter=None):
+        self.window = window
+        self.widget_counter = widget_counter
+        self.hooks = {}
+        self.lock = threading.Lock()
+        self.installed = []
+    
+    def stats(self, name):
+        with self.lock:
+            hook = self.hooks.get(name)
+            if hook is None:
+                hook = self.hooks[name] = HookStats(self.window)
+            return hook
+    
+    def record(self, name, duration, count_widgets=False):
+        hook = self.stats(name)
+        with self.lock:
+            hook.count += 1
+            hook.samples.append(duration)
+        if count_widgets and self.widget_counter is not None:
+            hook.widgets = self.widget_counter()
+    
+    def wrap(self, name, func, count_widgets=False):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start, count_widgets)
+        return timed
+    
+    def instrument(self, owner, names, count_widgets=()):
+        # Les méthodes ne sont remplacées qu'à l'activation: désactivé, rien n'est intercepté
+        prefix = getattr(owner, '__name__', type(owner).__name__)
+        for name in names:
+            original = getattr(owner, name)
+            setattr(owner, name, self.wrap(f"{prefix}.{name}", original, name in count_widgets))
+            self.installed.append((owner, name, original))
+    
+    def uninstall(self):
+        for owner, name, original in reversed(self.installed):
+            setattr(owner, name, original)
+        self.installed = []
+    
+    def snapshot(self):
+        with self.lock:
+            return {name: self.hooks[name].summary() for name in sorted(self.hooks)}
+    
+    def reset(self):
+        with self.lock:
+            self.hooks = {}
+    
+    def export(self, path):
+        data = {'exported_at': datetime.now().isoformat(), 'hooks': self.snapshot()}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+def count_widgets(widget):
+    count = 0
+    stack = [widget]
+    while stack:
+        widget = stack.pop()
+        count += 1
+        stack.extend(widget.children.values())
+    return count
@@ -2,47 +2,48 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, colorchooser
-import json
 import os
+import time
 from datetime import datetime
-import random
+import argparse
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from board_model import BoardModel, KanbanCard, avatar_color, avatar_initials
+from activity_history import ActivityHistory
+from persistence import (BackgroundLoader, BackgroundSaver, BoardJournal, board_from_dict, read_snapshot,
+                         snapshot_board)
+from sqlite_store import SQLiteBoardStore
+from card_io import ImportReport, card_batches, write_cards
+from sync_client import OP_ERRORS, SyncClient, SyncSession
+from instrumentation import Profiler, count_widgets
 
 class ActivityLog:
-    def __init__(self):
-        self.activities = []
-    
-    def add(self, message):
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        self.activities.insert(0, f"[{timestamp}] {message}")
-        if len(self.activities) > 100:
-            self.activities = self.activities[:100]
-
-class KanbanCard:
-    def __init__(self, title, description="", assigned_to="", color="#ffffff"):
-        self.title = title
-        self.description = description
-        self.assigned_to = assigned_to
-        self.color = color
-        self.id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        self.avatar_color = self.generate_avatar_color(assigned_to)
-
-    def generate_avatar_color(self, name):
-        if not name:
-            return "#cccccc"
-        
-        colors = [
-            "#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FECA57",
-            "#FF9FF3", "#54A0FF", "#5F27CD", "#00D2D3", "#FF9F43",
-            "#FC427B", "#26DE81", "#2D98DA", "#A55EEA", "#FD79A8"
-        ]
-        index = sum(ord(c) for c in name) % len(colors)
-        return colors[index]
-
-class KanbanColumn:
-    def __init__(self, name, is_backlog=False):
-        self.name = name
-        self.cards = []
-        self.is_backlog = is_backlog
+    def __init__(self, capacity=1000, history=None):
+        self.capacity = capacity
+        self.history = history
+        self.entries = deque(maxlen=capacity)
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    @property
+    def activities(self):
+        return list(self.entries)
+    
+    @activities.setter
+    def activities(self, activities):
+        self.entries = deque(activities[:self.capacity], maxlen=self.capacity)
+    
+    def add(self, message, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        if self.history:
+            self.history.append(message, timestamp)
+        
+        entry = f"[{datetime.fromtimestamp(timestamp).strftime('%H:%M:%S')}] {message}"
+        evicted = self.entries[-1] if len(self.entries) == self.capacity else None
+        self.entries.appendleft(entry)
+        return entry, evicted
 
 class DropPlaceholder(tk.Frame):
     def __init__(self, parent):
@@ -54,96 +55,287 @@ class DropPlaceholder(tk.Frame):
                         bg='#3498db', fg='white')
         label.pack(expand=True)
 
-class AvatarWidget(tk.Frame):
-    def __init__(self, parent, name, color, size=24):
-        super().__init__(parent, bg=parent['bg'])
+class DropGeometry:
+    # Les index de dépôt comptent les lignes affichées, carte glissée comprise: elle garde sa ligne
+    def __init__(self, app):
+        self.app = app
+        self.bounds = None
+        self.lefts = []
+        self.midpoints = {}
+    
+    def invalidate(self, col_index=None):
+        if col_index is None:
+            self.bounds = None
+            self.midpoints = {}
+        else:
+            self.midpoints.pop(col_index, None)
+    
+    def build(self):
+        self.bounds = []
+        for col_frame in self.app.column_frames:
+            if not col_frame.winfo_exists():
+                continue
+            x = col_frame.winfo_rootx()
+            y = col_frame.winfo_rooty()
+            self.bounds.append((x, x + col_frame.winfo_width(), y, y + col_frame.winfo_height(), 
+                                col_frame.col_index))
+        self.bounds.sort()
+        self.lefts = [bound[0] for bound in self.bounds]
+        self.midpoints = {}
+    
+    def column_midpoints(self, col_index):
+        midpoints = self.midpoints.get(col_index)
+        if midpoints is None:
+            col_frame = self.app.column_frames[col_index]
+            midpoints = col_frame.card_midpoints()
+            self.midpoints[col_index] = midpoints
+        return midpoints
+    
+    def locate(self, x, y):
+        if self.bounds is None:
+            self.build()
         
-        self.canvas = tk.Canvas(self, width=size, height=size, 
-                               bg=parent['bg'], highlightthickness=0)
-        self.canvas.pack()
+        position = bisect_right(self.lefts, x) - 1
+        if position < 0:
+            return None, 0
+        
+        x0, x1, y0, y1, col_index = self.bounds[position]
+        if not (x <= x1 and y0 <= y <= y1):
+            return None, 0
+        
+        return col_index, bisect_right(self.column_midpoints(col_index), y)
+
+class DragSession:
+    def __init__(self, app, card, col_index, x, y):
+        self.app = app
+        self.card = card
+        self.col_index = col_index
+        self.target = None
+        self.geometry = DropGeometry(app)
+        app.drop_geometry = self.geometry
         
-        self.canvas.create_oval(2, 2, size-2, size-2, fill=color, outline='white', width=2)
+        self.drag_window = tk.Toplevel(app.root)
+        self.drag_window.wm_overrideredirect(True)
+        self.drag_window.configure(bg='#f39c12')
+        self.drag_window.attributes('-alpha', 0.8)
         
-        initials = self.get_initials(name)
-        self.canvas.create_text(size//2, size//2, text=initials, 
-                               fill='white', font=('Arial', int(size*0.4), 'bold'))
+        drag_frame = tk.Frame(self.drag_window, bg='#f39c12', padx=10, pady=5)
+        drag_frame.pack()
+        
+        tk.Label(drag_frame, text="📋", font=('Arial', 12), bg='#f39c12').pack(side='left')
+        tk.Label(drag_frame, text=card.title, 
+                font=('Arial', 9, 'bold'), bg='#f39c12', fg='white').pack(side='left', padx=(5, 0))
+        
+        if card.assigned_to:
+            tk.Label(drag_frame, text=f"@{card.assigned_to}", 
+                    font=('Arial', 8), bg='#f39c12', fg='#ecf0f1').pack(side='left', padx=(10, 0))
+        
+        self.drag_window.geometry(f"+{x+15}+{y+15}")
+        self.drag_window.lift()
     
-    def get_initials(self, name):
-        if not name:
-            return "?"
+    def accepts(self, target_col):
+        if target_col is None:
+            return False
+        return not (self.app.columns[target_col].is_backlog and 
+                    not self.app.columns[self.col_index].is_backlog)
+    
+    def move(self, x, y):
+        self.drag_window.geometry(f"+{x+15}+{y+15}")
         
-        parts = name.strip().split()
-        if len(parts) == 1:
-            return parts[0][:2].upper()
-        else:
-            return (parts[0][0] + parts[-1][0]).upper()
+        target_col, insert_index = self.geometry.locate(x, y)
+        target = (target_col, insert_index) if self.accepts(target_col) else None
+        if target != self.target:
+            self.set_target(target)
+    
+    def set_target(self, target):
+        old_col = self.target[0] if self.target else None
+        new_col = target[0] if target else None
+        
+        if old_col is not None and old_col != new_col:
+            col_frame = self.app.column_frames[old_col]
+            col_frame.hide_placeholder()
+            col_frame.set_highlight(False)
+        
+        if target:
+            col_frame = self.app.column_frames[new_col]
+            if old_col != new_col:
+                col_frame.set_highlight(True)
+            col_frame.show_placeholder(target[1])
+        
+        self.target = target
+    
+    def finish(self, x, y):
+        target = self.geometry.locate(x, y)
+        self.close()
+        return target
+    
+    def close(self):
+        self.set_target(None)
+        if self.drag_window:
+            self.drag_window.destroy()
+            self.drag_window = None
+        if self.app.drop_geometry is self.geometry:
+            self.app.drop_geometry = None
+
+class AvatarCache:
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.avatars = OrderedDict()
+        self.discs = {}
+    
+    def disc(self, color, size):
+        image = self.discs.get((color, size))
+        if image is None:
+            image = tk.PhotoImage(width=size, height=size)
+            center = (size - 1) / 2
+            for radius, fill in ((size / 2 - 1, 'white'), (size / 2 - 3, color)):
+                for y in range(size):
+                    dy = y - center
+                    if abs(dy) > radius:
+                        continue
+                    dx = (radius * radius - dy * dy) ** 0.5
+                    x0 = max(0, int(round(center - dx)))
+                    x1 = min(size, int(round(center + dx)) + 1)
+                    if x1 > x0:
+                        image.put(fill, to=(x0, y, x1, y + 1))
+            self.discs[(color, size)] = image
+        return image
+    
+    def get(self, name, size):
+        key = (name, size)
+        avatar = self.avatars.get(key)
+        if avatar is not None:
+            self.avatars.move_to_end(key)
+            return avatar
+        
+        avatar = (self.disc(avatar_color(name), size), avatar_initials(name))
+        self.avatars[key] = avatar
+        if len(self.avatars) > self.capacity:
+            self.avatars.popitem(last=False)
+        return avatar
+
+AVATARS = AvatarCache()
+
+class AvatarWidget(tk.Label):
+    def __init__(self, parent, name, size=24):
+        super().__init__(parent, bg=parent['bg'], fg='white', compound='center', 
+                         font=('Arial', int(size*0.4), 'bold'),
+                         borderwidth=0, highlightthickness=0, padx=0, pady=0)
+        self.size = size
+        self.set_avatar(name, parent['bg'])
+    
+    def set_avatar(self, name, bg):
+        image, initials = AVATARS.get(name, self.size)
+        self.configure(image=image, text=initials, bg=bg)
 
 class DragDropCard(tk.Frame):
-    def __init__(self, parent, card, app, col_index, card_index):
+    HEIGHT = 90
+    SPACING = 8
+    
+    def __init__(self, parent, card, app, col_index):
         super().__init__(parent, bg=card.color, relief='solid', borderwidth=1, 
-                        padx=8, pady=6, cursor='hand2', width=220, height=90)
+                        padx=8, pady=6, cursor='hand2', width=220, height=self.HEIGHT)
         
         self.card = card
         self.app = app
         self.col_index = col_index
-        self.card_index = card_index
         self.dragging = False
-        self.drag_window = None
-        self.placeholder = None
+        self.session = None
+        self.window_item = None
+        self.y = None
+        self.selected = False
         
         self.pack_propagate(False)
+        self.signature = None
         self.setup_ui()
         self.setup_drag()
     
+    @staticmethod
+    def card_signature(card):
+        return (card.title, card.description, card.assigned_to, card.color)
+    
+    def update_card(self, card):
+        self.card = card
+        self.apply_card()
+    
+    def set_selected(self, selected):
+        if selected != self.selected:
+            self.selected = selected
+            self.configure(highlightthickness=3 if selected else 0,
+                           highlightbackground='#e67e22', highlightcolor='#e67e22')
+    
+    def toggle_select(self, event):
+        self.app.toggle_selection(self.card.id)
+        return "break"
+    
     def setup_ui(self):
-        header_frame = tk.Frame(self, bg=self.card.color)
-        header_frame.pack(fill='x', pady=(0, 3))
+        self.header_frame = tk.Frame(self)
+        self.header_frame.pack(fill='x', pady=(0, 3))
         
-        title_label = tk.Label(header_frame, text=self.card.title, 
-                              font=('Arial', 9, 'bold'), bg=self.card.color,
-                              wraplength=180, justify='left')
-        title_label.pack(anchor='w', side='left', fill='x', expand=True)
+        self.title_label = tk.Label(self.header_frame, font=('Arial', 9, 'bold'), 
+                                    wraplength=180, justify='left')
+        self.title_label.pack(anchor='w', side='left', fill='x', expand=True)
         
-        if self.card.assigned_to:
-            avatar_frame = tk.Frame(header_frame, bg=self.card.color)
-            avatar_frame.pack(side='right')
-            
-            avatar = AvatarWidget(avatar_frame, self.card.assigned_to, 
-                                 self.card.avatar_color, size=20)
-            avatar.pack()
+        self.avatar_frame = tk.Frame(self.header_frame)
+        self.avatar = AvatarWidget(self.avatar_frame, "", size=20)
+        self.avatar.pack()
         
-        if self.card.assigned_to:
-            assigned_frame = tk.Frame(self, bg=self.card.color)
-            assigned_frame.pack(fill='x', pady=(0, 3))
-            
-            assigned_label = tk.Label(assigned_frame, text=f"@{self.card.assigned_to}", 
-                                    font=('Arial', 8), bg=self.card.color, fg='#2c3e50')
-            assigned_label.pack(anchor='w')
+        self.assigned_frame = tk.Frame(self)
+        self.assigned_label = tk.Label(self.assigned_frame, font=('Arial', 8), fg='#2c3e50')
+        self.assigned_label.pack(anchor='w')
         
-        if self.card.description:
-            desc = self.card.description[:45] + "..." if len(self.card.description) > 45 else self.card.description
-            desc_label = tk.Label(self, text=desc, font=('Arial', 7), 
-                                bg=self.card.color, fg='#7f8c8d', 
-                                wraplength=200, justify='left')
-            desc_label.pack(anchor='w', fill='x')
+        self.desc_label = tk.Label(self, font=('Arial', 7), fg='#7f8c8d', 
+                                   wraplength=200, justify='left')
         
-        btn_frame = tk.Frame(self, bg=self.card.color)
-        btn_frame.pack(fill='x', pady=(3, 0))
+        self.btn_frame = tk.Frame(self)
+        self.btn_frame.pack(fill='x', pady=(3, 0))
         
-        edit_btn = tk.Button(btn_frame, text="✏", width=2, height=1,
+        edit_btn = tk.Button(self.btn_frame, text="✏", width=2, height=1,
                            bg='#3498db', fg='white', font=('Arial', 7),
                            command=self.edit, cursor='hand2')
         edit_btn.pack(side='right', padx=1)
         
-        delete_btn = tk.Button(btn_frame, text="✗", width=2, height=1,
+        delete_btn = tk.Button(self.btn_frame, text="✗", width=2, height=1,
                              bg='#e74c3c', fg='white', font=('Arial', 7),
                              command=self.delete, cursor='hand2')
         delete_btn.pack(side='right')
+        
+        self.apply_card()
+    
+    def apply_card(self):
+        signature = self.card_signature(self.card)
+        if signature == self.signature:
+            return
+        
+        self.signature = signature
+        card = self.card
+        for widget in (self, self.header_frame, self.title_label, self.avatar_frame,
+                       self.assigned_frame, self.assigned_label, self.desc_label, self.btn_frame):
+            widget.configure(bg=card.color)
+        
+        self.title_label.configure(text=card.title)
+        
+        if card.assigned_to:
+            self.avatar.set_avatar(card.assigned_to, card.color)
+            self.avatar_frame.pack(side='right')
+            self.assigned_label.configure(text=f"@{card.assigned_to}")
+            self.assigned_frame.pack(fill='x', pady=(0, 3), after=self.header_frame)
+        else:
+            self.avatar_frame.pack_forget()
+            self.assigned_frame.pack_forget()
+        
+        if card.description:
+            desc = card.description[:45] + "..." if len(card.description) > 45 else card.description
+            self.desc_label.configure(text=desc)
+            self.desc_label.pack(anchor='w', fill='x', before=self.btn_frame)
+        else:
+            self.desc_label.pack_forget()
     
     def setup_drag(self):
         self.bind('<Button-1>', self.start_drag)
         self.bind('<B1-Motion>', self.on_drag)
         self.bind('<ButtonRelease-1>', self.end_drag)
+        self.bind('<Control-Button-1>', self.toggle_select)
         
         self.bind_children_drag(self)
     
@@ -153,133 +345,36 @@ class DragDropCard(tk.Frame):
                 child.bind('<Button-1>', self.start_drag)
                 child.bind('<B1-Motion>', self.on_drag)
                 child.bind('<ButtonRelease-1>', self.end_drag)
+                child.bind('<Control-Button-1>', self.toggle_select)
                 self.bind_children_drag(child)
     
     def start_drag(self, event):
         self.dragging = True
-        self.start_x = event.x_root
-        self.start_y = event.y_root
         
         self.configure(relief='raised', borderwidth=2)
         self.lift()
         
-        self.drag_window = tk.Toplevel(self.app.root)
-        self.drag_window.wm_overrideredirect(True)
-        self.drag_window.configure(bg='#f39c12')
-        self.drag_window.attributes('-alpha', 0.8)
-        
-        drag_frame = tk.Frame(self.drag_window, bg='#f39c12', padx=10, pady=5)
-        drag_frame.pack()
-        
-        tk.Label(drag_frame, text="📋", font=('Arial', 12), bg='#f39c12').pack(side='left')
-        tk.Label(drag_frame, text=self.card.title, 
-                font=('Arial', 9, 'bold'), bg='#f39c12', fg='white').pack(side='left', padx=(5, 0))
-        
-        if self.card.assigned_to:
-            tk.Label(drag_frame, text=f"@{self.card.assigned_to}", 
-                    font=('Arial', 8), bg='#f39c12', fg='#ecf0f1').pack(side='left', padx=(10, 0))
-        
-        self.drag_window.geometry(f"+{event.x_root+15}+{event.y_root+15}")
-        self.drag_window.lift()
+        self.session = DragSession(self.app, self.card, self.col_index, event.x_root, event.y_root)
     
     def on_drag(self, event):
-        if self.dragging and self.drag_window:
-            self.drag_window.geometry(f"+{event.x_root+15}+{event.y_root+15}")
-            
-            self.update_placeholder(event.x_root, event.y_root)
-    
-    def update_placeholder(self, x, y):
-        target_col, insert_index = self.find_drop_position(x, y)
-        
-        if self.placeholder:
-            self.placeholder.destroy()
-            self.placeholder = None
-        
-        for col_frame in self.app.column_frames:
-            col_frame.configure(relief='solid', borderwidth=2)
-        
-        if target_col is not None and target_col != self.col_index:
-            target_column = self.app.columns[target_col]
-            
-            source_col = self.app.columns[self.col_index]
-            if not (target_column.is_backlog and not source_col.is_backlog):
-                col_frame = self.app.column_frames[target_col]
-                col_frame.configure(relief='solid', borderwidth=4, bg='#e8f5e8')
-                
-                cards_container = self.find_cards_container(col_frame)
-                if cards_container:
-                    self.placeholder = DropPlaceholder(cards_container)
-                    
-                    children = [child for child in cards_container.winfo_children() 
-                               if isinstance(child, (DragDropCard, DropPlaceholder))]
-                    
-                    if insert_index < len(children):
-                        self.placeholder.pack_forget()
-                        self.placeholder.pack(fill='x', pady=3, padx=2, before=children[insert_index])
-                    else:
-                        self.placeholder.pack(fill='x', pady=3, padx=2)
-    
-    def find_cards_container(self, col_frame):
-        for child in col_frame.winfo_children():
-            if isinstance(child, tk.Frame):
-                for subchild in child.winfo_children():
-                    if isinstance(subchild, tk.Canvas):
-                        for canvas_child in subchild.winfo_children():
-                            if isinstance(canvas_child, tk.Frame):
-                                return canvas_child
-        return None
+        if self.dragging and self.session:
+            self.session.move(event.x_root, event.y_root)
     
     def find_drop_position(self, x, y):
-        for col_index, col_frame in enumerate(self.app.column_frames):
-            if not col_frame.winfo_exists():
-                continue
-                
-            col_x = col_frame.winfo_rootx()
-            col_y = col_frame.winfo_rooty()
-            col_w = col_frame.winfo_width()
-            col_h = col_frame.winfo_height()
-            
-            if col_x <= x <= col_x + col_w and col_y <= y <= col_y + col_h:
-                cards_container = self.find_cards_container(col_frame)
-                if cards_container:
-                    insert_index = 0
-                    for child in cards_container.winfo_children():
-                        if isinstance(child, DragDropCard) and child != self:
-                            child_y = child.winfo_rooty() + child.winfo_height() // 2
-                            if y < child_y:
-                                break
-                            insert_index += 1
-                    return col_index, insert_index
-                
-                return col_index, 0
-        
-        return None, 0
+        geometry = self.session.geometry if self.session else DropGeometry(self.app)
+        return geometry.locate(x, y)
     
     def end_drag(self, event):
         if not self.dragging:
             return
         
         self.dragging = False
-        
-        if self.drag_window:
-            self.drag_window.destroy()
-            self.drag_window = None
-        
-        if self.placeholder:
-            self.placeholder.destroy()
-            self.placeholder = None
-            
         self.configure(relief='solid', borderwidth=1)
         
-        for col_frame in self.app.column_frames:
-            col_frame.configure(relief='solid', borderwidth=2)
-            column = self.app.columns[self.app.column_frames.index(col_frame)]
-            original_bg = '#3498db' if column.is_backlog else '#95a5a6'
-            col_frame.configure(bg=original_bg)
-        
-        target_col, _ = self.find_drop_position(event.x_root, event.y_root)
+        target_col, index = self.session.finish(event.x_root, event.y_root)
+        self.session = None
         
-        if target_col is not None and target_col != self.col_index:
+        if target_col is not None:
             source_col = self.app.columns[self.col_index]
             target_column = self.app.columns[target_col]
             
@@ -287,13 +382,13 @@ class DragDropCard(tk.Frame):
                 messagebox.showwarning("Interdit", "Impossible de déplacer une carte vers le backlog")
                 return
             
-            self.app.move_card(self.col_index, self.card_index, target_col)
+            self.app.move_card(self.card.id, target_col, index)
     
     def edit(self):
-        self.app.edit_card(self.col_index, self.card_index)
+        self.app.edit_card(self.card.id)
     
     def delete(self):
-        self.app.delete_card(self.col_index, self.card_index)
+        self.app.delete_card(self.card.id)
 
 class CardDialog:
     def __init__(self, parent, card=None):
@@ -342,6 +437,7 @@ class CardDialog:
         
         self.avatar_preview_frame = tk.Frame(assigned_input_frame, bg='white')
         self.avatar_preview_frame.pack(side='right', padx=(10, 0))
+        self.avatar_preview = AvatarWidget(self.avatar_preview_frame, "", size=25)
         
         color_frame = tk.Frame(main_frame)
         color_frame.pack(fill='x', pady=(0, 15))
@@ -388,14 +484,12 @@ class CardDialog:
                  command=self.ok).pack(side='right')
     
     def update_avatar_preview(self, *args):
-        for child in self.avatar_preview_frame.winfo_children():
-            child.destroy()
-        
         name = self.assigned_var.get().strip()
         if name:
-            temp_card = KanbanCard("", assigned_to=name)
-            avatar = AvatarWidget(self.avatar_preview_frame, name, temp_card.avatar_color, size=25)
-            avatar.pack()
+            self.avatar_preview.set_avatar(name, 'white')
+            self.avatar_preview.pack()
+        else:
+            self.avatar_preview.pack_forget()
     
     def center_window(self):
         self.window.update_idletasks()
@@ -430,9 +524,16 @@ class CardDialog:
         self.window.destroy()
 
 class ResizableActivityPanel:
+    PAGE_SIZE = 200
+    
     def __init__(self, parent, activity_log):
         self.parent = parent
         self.activity_log = activity_log
+        self.history = activity_log.history
+        self.history_cursor = None
+        self.history_done = True
+        self.history_skip = 0
+        self.page_job = None
         
         self.main_frame = tk.Frame(parent)
         self.main_frame.pack(side='right', fill='y')
@@ -458,11 +559,11 @@ class ResizableActivityPanel:
         
         self.activity_listbox = tk.Listbox(content_frame, font=('Arial', 8), 
                                           bg='white', selectmode='none')
-        activity_scroll = tk.Scrollbar(content_frame, command=self.activity_listbox.yview)
-        self.activity_listbox.config(yscrollcommand=activity_scroll.set)
+        self.activity_scroll = tk.Scrollbar(content_frame, command=self.activity_listbox.yview)
+        self.activity_listbox.config(yscrollcommand=self.on_list_scroll)
         
         self.activity_listbox.pack(side='left', fill='both', expand=True)
-        activity_scroll.pack(side='right', fill='y')
+        self.activity_scroll.pack(side='right', fill='y')
         
         tk.Button(self.activity_frame, text="🔄 Actualiser", 
                  font=('Arial', 8), bg='#3498db', fg='white', relief='flat',
@@ -480,47 +581,737 @@ class ResizableActivityPanel:
         self.activity_frame.config(width=new_width)
     
     def add_activity(self, message):
-        self.activity_log.add(message)
-        self.refresh()
+        timestamp = time.time()
+        entry, evicted = self.activity_log.add(message, timestamp)
+        if self.history:
+            self.activity_listbox.insert(0, self.format_record({'ts': timestamp, 'message': message}))
+            if self.activity_listbox.size() > self.PAGE_SIZE:
+                # Les lignes retirées restent sur disque: la pagination les relira en descendant
+                self.activity_listbox.delete(self.PAGE_SIZE, tk.END)
+                self.history_skip = self.PAGE_SIZE
+                self.history_done = False
+        else:
+            if evicted is not None:
+                self.activity_listbox.delete(tk.END)
+            self.activity_listbox.insert(0, entry)
+        self.activity_listbox.see(0)
+    
+    @staticmethod
+    def format_record(record):
+        return f"[{datetime.fromtimestamp(record['ts']).strftime('%d/%m %H:%M:%S')}] {record['message']}"
     
     def refresh(self):
         self.activity_listbox.delete(0, tk.END)
-        for activity in self.activity_log.activities:
-            self.activity_listbox.insert(tk.END, activity)
-        if self.activity_log.activities:
+        if self.history:
+            self.history_cursor = None
+            self.history_done = False
+            self.history_skip = 0
+            if self.load_history_page():
+                self.activity_listbox.see(0)
+                return
+        
+        self.history_done = True
+        if len(self.activity_log):
+            self.activity_listbox.insert(tk.END, *self.activity_log.entries)
             self.activity_listbox.see(0)
+    
+    def load_history_page(self):
+        self.page_job = None
+        if self.history_done:
+            return 0
+        
+        if self.history_skip:
+            # Curseur repositionné après les lignes affichées, les plus récentes du journal
+            _, self.history_cursor = self.history.read_page(None, self.history_skip)
+            self.history_skip = 0
+            if self.history_cursor is None:
+                self.history_done = True
+                return 0
+        
+        records, self.history_cursor = self.history.read_page(self.history_cursor, self.PAGE_SIZE)
+        self.history_done = self.history_cursor is None
+        if records:
+            self.activity_listbox.insert(tk.END, *[self.format_record(record) for record in records])
+        return len(records)
+    
+    def on_list_scroll(self, first, last):
+        self.activity_scroll.set(first, last)
+        if not self.history_done and self.page_job is None and float(last) >= 0.98:
+            self.page_job = self.activity_listbox.after_idle(self.load_history_page)
+
+class PerformancePanel:
+    REFRESH_MS = 1000
+    COLUMNS = (('count', "n", 55), ('p50_ms', "p50 ms", 60), ('p95_ms', "p95 ms", 60),
+               ('max_ms', "max ms", 60), ('widgets', "widgets", 60))
+    
+    def __init__(self, parent, profiler):
+        self.profiler = profiler
+        self.rows = {}
+        
+        self.frame = tk.Frame(parent, bg='#ecf0f1', width=480)
+        self.frame.pack(side='right', fill='y')
+        self.frame.pack_propagate(False)
+        
+        header = tk.Frame(self.frame, bg='#34495e', height=50)
+        header.pack(fill='x')
+        header.pack_propagate(False)
+        
+        tk.Label(header, text="⏱ Performances", 
+                font=('Arial', 11, 'bold'), bg='#34495e', fg='white').pack(expand=True)
+        
+        content_frame = tk.Frame(self.frame, bg='#ecf0f1')
+        content_frame.pack(fill='both', expand=True, padx=8, pady=8)
+        
+        self.tree = ttk.Treeview(content_frame, columns=[name for name, _, _ in self.COLUMNS],
+                                 show='tree headings')
+        self.tree.heading('#0', text="Point de mesure")
+        self.tree.column('#0', width=170)
+        for name, title, width in self.COLUMNS:
+            self.tree.heading(name, text=title)
+            self.tree.column(name, width=width, anchor='e')
+        tree_scroll = tk.Scrollbar(content_frame, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=tree_scroll.set)
+        
+        self.tree.pack(side='left', fill='both', expand=True)
+        tree_scroll.pack(side='right', fill='y')
+        
+        btn_frame = tk.Frame(self.frame, bg='#ecf0f1')
+        btn_frame.pack(fill='x', padx=8, pady=(0, 8))
+        
+        tk.Button(btn_frame, text="💾 Exporter", font=('Arial', 8), bg='#3498db', fg='white',
+                 relief='flat', command=self.export).pack(side='left', fill='x', expand=True, padx=(0, 2))
+        tk.Button(btn_frame, text="♻ Réinitialiser", font=('Arial', 8), bg='#95a5a6', fg='white',
+                 relief='flat', command=self.reset).pack(side='left', fill='x', expand=True, padx=(2, 0))
+        
+        self.refresh()
+    
+    def refresh(self):
+        for name, summary in self.profiler.snapshot().items():
+            values = (summary['count'], f"{summary['p50_ms']:.2f}", f"{summary['p95_ms']:.2f}",
+                      f"{summary['max_ms']:.2f}", "" if summary['widgets'] is None else summary['widgets'])
+            item = self.rows.get(name)
+            if item is None:
+                self.rows[name] = self.tree.insert('', 'end', text=name, values=values)
+            else:
+                self.tree.item(item, values=values)
+        self.frame.after(self.REFRESH_MS, self.refresh)
+    
+    def reset(self):
+        self.profiler.reset()
+        self.tree.delete(*self.rows.values())
+        self.rows = {}
+    
+    def export(self):
+        from tkinter import filedialog
+        
+        filename = filedialog.asksaveasfilename(defaultextension='.json', initialfile="kanban_profile.json",
+                                                filetypes=[('JSON files', '*.json'), ('All files', '*.*')])
+        if not filename:
+            return
+        
+        try:
+            self.profiler.export(filename)
+            messagebox.showinfo("Succès", f"Mesures exportées: {os.path.basename(filename)}")
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur d'export:\n{str(e)}")
+
+class WidgetCardRenderer:
+    POOL_SIZE = 30
+    
+    def __init__(self, col_frame):
+        self.col_frame = col_frame
+        self.app = col_frame.app
+        self.canvas = col_frame.cards_canvas
+        self.card_widgets = {}
+        self.pool = []
+    
+    def set_index(self, col_index):
+        for widget in self.card_widgets.values():
+            widget.col_index = col_index
+    
+    def resize(self):
+        for widget in self.card_widgets.values():
+            self.canvas.itemconfigure(widget.window_item, width=self.col_frame.card_width())
+    
+    def acquire_widget(self, card):
+        if self.pool:
+            widget = self.pool.pop()
+            widget.col_index = self.col_frame.col_index
+            widget.update_card(card)
+            self.canvas.itemconfigure(widget.window_item, state='normal')
+        else:
+            widget = DragDropCard(self.canvas, card, self.app, self.col_frame.col_index)
+            widget.window_item = self.canvas.create_window(3, 0, window=widget, anchor='nw',
+                                                           width=self.col_frame.card_width(),
+                                                           height=DragDropCard.HEIGHT)
+        return widget
+    
+    def release_widget(self, widget):
+        if self.app.virtual and len(self.pool) < self.POOL_SIZE:
+            self.canvas.itemconfigure(widget.window_item, state='hidden')
+            widget.y = None
+            self.pool.append(widget)
+        else:
+            self.canvas.delete(widget.window_item)
+            widget.destroy()
+    
+    def render(self, cards, first, last):
+        visible = cards[first:last]
+        visible_ids = {card.id for card in visible}
+        
+        for card_id in [card_id for card_id in self.card_widgets if card_id not in visible_ids]:
+            self.release_widget(self.card_widgets.pop(card_id))
+        
+        for card_index, card in enumerate(visible, first):
+            widget = self.card_widgets.get(card.id)
+            if widget is None:
+                widget = self.acquire_widget(card)
+                self.card_widgets[card.id] = widget
+            else:
+                widget.col_index = self.col_frame.col_index
+                widget.update_card(card)
+            widget.set_selected(card.id in self.app.selection)
+            
+            y = self.col_frame.row_y(card_index)
+            if widget.y != y:
+                widget.y = y
+                self.canvas.coords(widget.window_item, 3, y)
+
+class CanvasCardRenderer:
+    def __init__(self, col_frame):
+        self.col_frame = col_frame
+        self.app = col_frame.app
+        self.canvas = col_frame.cards_canvas
+        self.drawn = {}
+        self.session = None
+        self.drag_card_id = None
+        
+        self.canvas.tag_bind('card_body', '<Button-1>', self.start_drag)
+        self.canvas.tag_bind('card_body', '<Control-Button-1>', lambda e: self.on_button(self.app.toggle_selection))
+        self.canvas.tag_bind('card_edit', '<Button-1>', lambda e: self.on_button(self.app.edit_card))
+        self.canvas.tag_bind('card_delete', '<Button-1>', lambda e: self.on_button(self.app.delete_card))
+        for tag in ('card_body', 'card_edit', 'card_delete'):
+            self.canvas.tag_bind(tag, '<Enter>', lambda e: self.canvas.configure(cursor='hand2'))
+            self.canvas.tag_bind(tag, '<Leave>', lambda e: self.canvas.configure(cursor=''))
+        self.canvas.bind('<B1-Motion>', self.on_drag, add='+')
+        self.canvas.bind('<ButtonRelease-1>', self.end_drag, add='+')
+    
+    def set_index(self, col_index):
+        pass
+    
+    def resize(self):
+        for card_id in list(self.drawn):
+            self.canvas.delete(f"card:{card_id}")
+        self.drawn = {}
+    
+    def current_card_id(self):
+        for item in self.canvas.find_withtag('current'):
+            for tag in self.canvas.gettags(item):
+                if tag.startswith('card:'):
+                    return tag[5:]
+        return None
+    
+    def on_button(self, action):
+        card_id = self.current_card_id()
+        if card_id in self.app.board:
+            action(card_id)
+    
+    def start_drag(self, event):
+        card_id = self.current_card_id()
+        if card_id not in self.app.board or card_id not in self.drawn:
+            return
+        
+        self.drag_card_id = card_id
+        self.canvas.itemconfigure(self.drawn[card_id][2], width=2)
+        self.session = DragSession(self.app, self.app.board.get_card(card_id), 
+                                   self.col_frame.col_index, event.x_root, event.y_root)
+    
+    def on_drag(self, event):
+        if self.session:
+            self.session.move(event.x_root, event.y_root)
+    
+    def end_drag(self, event):
+        if not self.session:
+            return
+        
+        session = self.session
+        self.session = None
+        target_col, index = session.finish(event.x_root, event.y_root)
+        if self.drag_card_id in self.drawn:
+            self.canvas.itemconfigure(self.drawn[self.drag_card_id][2],
+                                      width=3 if self.drag_card_id in self.app.selection else 1)
+        
+        card_id = self.drag_card_id
+        self.drag_card_id = None
+        if card_id not in self.app.board or target_col is None:
+            return
+        
+        if self.app.columns[target_col].is_backlog and not self.col_frame.column.is_backlog:
+            messagebox.showwarning("Interdit", "Impossible de déplacer une carte vers le backlog")
+            return
+        
+        self.app.move_card(card_id, target_col, index)
+    
+    def draw(self, card, y):
+        tag = f"card:{card.id}"
+        body = (tag, 'card_body')
+        x0 = 3
+        x1 = x0 + self.col_frame.card_width()
+        
+        selected = card.id in self.app.selection
+        rect = self.canvas.create_rectangle(x0, y, x1, y + DragDropCard.HEIGHT, fill=card.color,
+                                            outline='#e67e22' if selected else '#000000',
+                                            width=3 if selected else 1, tags=body)
+        
+        title = card.title if len(card.title) <= 60 else card.title[:60] + "..."
+        self.canvas.create_text(x0 + 9, y + 7, text=title, anchor='nw', 
+                                font=('Arial', 9, 'bold'), width=180, tags=body)
+        
+        text_y = y + 28
+        if card.assigned_to:
+            ax = x1 - 29
+            ay = y + 6
+            image, initials = AVATARS.get(card.assigned_to, 20)
+            self.canvas.create_image(ax, ay, image=image, anchor='nw', tags=body)
+            self.canvas.create_text(ax + 10, ay + 10, text=initials, 
+                                    fill='white', font=('Arial', 8, 'bold'), tags=body)
+            self.canvas.create_text(x0 + 9, text_y, text=f"@{card.assigned_to}", anchor='nw', 
+                                    font=('Arial', 8), fill='#2c3e50', tags=body)
+            text_y += 16
+        
+        if card.description:
+            desc = card.description[:45] + "..." if len(card.description) > 45 else card.description
+            self.canvas.create_text(x0 + 9, text_y, text=desc, anchor='nw', 
+                                    font=('Arial', 7), fill='#7f8c8d', width=200, tags=body)
+        
+        by = y + DragDropCard.HEIGHT - 22
+        for offset, text, color, action_tag in ((27, "✗", '#e74c3c', 'card_delete'), 
+                                                 (48, "✏", '#3498db', 'card_edit')):
+            bx = x1 - offset
+            self.canvas.create_rectangle(bx, by, bx + 18, by + 16, fill=color, outline='', 
+                                         tags=(tag, action_tag))
+            self.canvas.create_text(bx + 9, by + 8, text=text, fill='white', 
+                                    font=('Arial', 7), tags=(tag, action_tag))
+        
+        return rect
+    
+    def render(self, cards, first, last):
+        visible = cards[first:last]
+        visible_ids = {card.id for card in visible}
+        
+        for card_id in [card_id for card_id in self.drawn if card_id not in visible_ids]:
+            self.canvas.delete(f"card:{card_id}")
+            del self.drawn[card_id]
+        
+        for card_index, card in enumerate(visible, first):
+            y = self.col_frame.row_y(card_index)
+            signature = (DragDropCard.card_signature(card), card.id in self.app.selection)
+            drawn = self.drawn.get(card.id)
+            if drawn is not None and drawn[0] != signature:
+                self.canvas.delete(f"card:{card.id}")
+                drawn = None
+            
+            if drawn is None:
+                self.drawn[card.id] = (signature, y, self.draw(card, y))
+            elif drawn[1] != y:
+                self.canvas.move(f"card:{card.id}", 0, y - drawn[1])
+                self.drawn[card.id] = (signature, y, drawn[2])
+
+class ColumnFrame(tk.Frame):
+    SLOT = DragDropCard.HEIGHT + DragDropCard.SPACING
+    OVERSCAN = 4
+    LANE_HEADER = 26
+    
+    def __init__(self, parent, app, column, col_index, col_width):
+        super().__init__(parent, 
+                         bg='#3498db' if column.is_backlog else '#95a5a6', 
+                         relief='solid', borderwidth=2, 
+                         width=col_width, height=750)
+        self.app = app
+        self.column = column
+        self.col_index = col_index
+        self.header_text = None
+        self.canvas_width = col_width
+        self.placeholder = None
+        self.placeholder_item = None
+        self.placeholder_index = None
+        self.view_top = 0
+        self.rows = column.cards
+        self.row_tops = None
+        self.lane_tops = []
+        self.lanes_end = 0
+        
+        self.grid_propagate(False)
+        self.setup_ui()
+        self.sync_cards()
+    
+    def setup_ui(self):
+        header = tk.Frame(self, 
+                         bg='#2980b9' if self.column.is_backlog else '#7f8c8d', 
+                         height=70)
+        header.pack(fill='x')
+        header.pack_propagate(False)
+        
+        self.title_label = tk.Label(header, font=('Arial', 10, 'bold'), 
+                                    bg='#2980b9' if self.column.is_backlog else '#7f8c8d', 
+                                    fg='white', justify='center')
+        self.title_label.pack(expand=True)
+        
+        self.btn_frame = None
+        if not self.column.is_backlog:
+            self.btn_frame = tk.Frame(header, bg='#7f8c8d')
+            self.btn_frame.pack(side='bottom', fill='x')
+            self.update_buttons()
+        
+        cards_container_frame = tk.Frame(self, bg='white')
+        cards_container_frame.pack(fill='both', expand=True, padx=3, pady=3)
+        
+        self.cards_canvas = tk.Canvas(cards_container_frame, bg='white', highlightthickness=0)
+        self.cards_scroll = tk.Scrollbar(cards_container_frame, orient='vertical', 
+                                        command=self.cards_canvas.yview, width=12)
+        self.cards_canvas.configure(yscrollcommand=self.on_scroll)
+        
+        self.cards_canvas.pack(side='left', fill='both', expand=True)
+        self.cards_scroll.pack(side='right', fill='y')
+        
+        if self.app.renderer == 'canvas':
+            self.renderer = CanvasCardRenderer(self)
+        else:
+            self.renderer = WidgetCardRenderer(self)
+        
+        self.add_btn = None
+        self.add_btn_item = None
+        if self.column.is_backlog:
+            self.add_btn = tk.Button(self.cards_canvas, text="➕ Nouvelle carte", 
+                                     font=('Arial', 9, 'bold'),
+                                     bg='#27ae60', fg='white', pady=6, relief='flat',
+                                     command=self.app.add_card_to_backlog)
+            self.add_btn_item = self.cards_canvas.create_window(5, 0, window=self.add_btn, anchor='nw')
+        
+        self.cards_canvas.bind('<MouseWheel>', 
+                               lambda e: self.cards_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+        self.cards_canvas.bind('<Configure>', self.on_canvas_configure)
+    
+    def set_highlight(self, highlighted):
+        if highlighted:
+            self.configure(relief='solid', borderwidth=4, bg='#e8f5e8')
+        else:
+            self.configure(relief='solid', borderwidth=2, 
+                           bg='#3498db' if self.column.is_backlog else '#95a5a6')
+    
+    def update_buttons(self):
+        for child in self.btn_frame.winfo_children():
+            child.destroy()
+        
+        if self.col_index > 1:
+            left_btn = tk.Button(self.btn_frame, text="◀", width=3, height=1,
+                               bg='white', font=('Arial', 7),
+                               command=lambda: self.app.move_column_left(self.col_index))
+            left_btn.pack(side='left', padx=1)
+        
+        if self.col_index < len(self.app.columns) - 1:
+            right_btn = tk.Button(self.btn_frame, text="▶", width=3, height=1,
+                                bg='white', font=('Arial', 7),
+                                command=lambda: self.app.move_column_right(self.col_index))
+            right_btn.pack(side='left', padx=1)
+    
+    def update_header(self):
+        title_text = self.column.name.replace(' ', '\n') if len(self.column.name) > 10 else self.column.name
+        if self.app.card_filter is None:
+            header_text = f"{title_text}\n({len(self.column.cards)})"
+        else:
+            header_text = f"{title_text}\n({len(self.rows)}/{len(self.column.cards)})"
+        if header_text != self.header_text:
+            self.header_text = header_text
+            self.title_label.configure(text=header_text)
+    
+    def set_index(self, col_index):
+        self.col_index = col_index
+        self.grid_configure(column=col_index)
+        if self.btn_frame:
+            self.update_buttons()
+        self.renderer.set_index(col_index)
+    
+    def on_scroll(self, first, last):
+        self.cards_scroll.set(first, last)
+        top = self.cards_canvas.canvasy(0)
+        if top != self.view_top:
+            self.view_top = top
+            if self.app.drop_geometry:
+                self.app.drop_geometry.invalidate(self.col_index)
+        if self.app.virtual:
+            self.render_cards()
+    
+    def on_canvas_configure(self, event):
+        if self.app.drop_geometry:
+            self.app.drop_geometry.invalidate()
+        if event.width != self.canvas_width:
+            self.canvas_width = event.width
+            self.renderer.resize()
+            if self.add_btn_item:
+                self.cards_canvas.itemconfigure(self.add_btn_item, width=self.canvas_width - 10)
+            if self.placeholder_item:
+                self.cards_canvas.itemconfigure(self.placeholder_item, width=self.card_width())
+            self.draw_lanes()
+            self.render_cards()
+        elif self.app.virtual:
+            self.render_cards()
+    
+    def card_width(self):
+        return max(1, self.canvas_width - 6)
+    
+    def slot_y(self, index):
+        if self.row_tops is None:
+            return DragDropCard.SPACING // 2 + index * self.SLOT
+        if index < len(self.row_tops):
+            return self.row_tops[index]
+        return self.lanes_end + DragDropCard.SPACING // 2
+    
+    def row_y(self, index):
+        y = self.slot_y(index)
+        if self.placeholder_index is not None and index >= self.placeholder_index:
+            y += self.SLOT
+        return y
+    
+    def content_height(self):
+        height = self.slot_y(len(self.rows)) - DragDropCard.SPACING // 2
+        if self.placeholder_index is not None:
+            height += self.SLOT
+        if self.add_btn:
+            height += self.add_btn.winfo_reqheight() + 16
+        return height
+    
+    def visible_range(self):
+        count = len(self.rows)
+        if not self.app.virtual:
+            return 0, count
+        
+        top = self.cards_canvas.canvasy(0)
+        height = self.cards_canvas.winfo_height()
+        if height <= 1:
+            height = 750
+        if self.row_tops is None:
+            first = max(0, int(top) // self.SLOT - self.OVERSCAN)
+            last = min(count, int(top + height) // self.SLOT + 1 + self.OVERSCAN)
+        else:
+            first = max(0, bisect_right(self.row_tops, top) - 1 - self.OVERSCAN)
+            last = min(count, bisect_right(self.row_tops, top + height) + self.OVERSCAN)
+        return first, max(first, last)
+    
+    def card_midpoints(self):
+        offset = self.cards_canvas.winfo_rooty() - self.cards_canvas.canvasy(0)
+        offset += DragDropCard.HEIGHT // 2
+        return [offset + self.slot_y(row) for row in range(len(self.rows))]
+    
+    def render_cards(self):
+        first, last = self.visible_range()
+        self.renderer.render(self.rows, first, last)
+        
+        if self.add_btn_item:
+            self.cards_canvas.coords(self.add_btn_item, 5, self.row_y(len(self.rows)) + 4)
+    
+    def update_scrollregion(self):
+        self.cards_canvas.configure(scrollregion=(0, 0, self.canvas_width, self.content_height()))
+    
+    def filter_rows(self):
+        card_filter = self.app.card_filter
+        if card_filter is None:
+            rows = self.column.cards
+        else:
+            rows = [card for card in self.column.cards if card.id in card_filter]
+        
+        self.row_tops = None
+        if self.app.lanes is not None:
+            rows = self.layout_lanes(rows)
+        self.rows = rows
+    
+    def layout_lanes(self, rows):
+        # Les couloirs ont la même hauteur dans toutes les colonnes pour rester alignés
+        lanes = self.app.lanes
+        lane_index = {name: i for i, (name, size) in enumerate(lanes)}
+        rows = sorted(rows, key=lambda card: lane_index.get(card.assigned_to, len(lanes)))
+        
+        self.row_tops = []
+        self.lane_tops = []
+        y = 0
+        row = 0
+        for name, size in lanes:
+            self.lane_tops.append((name, y))
+            top = y + self.LANE_HEADER + DragDropCard.SPACING // 2
+            while row < len(rows) and rows[row].assigned_to == name:
+                self.row_tops.append(top)
+                top += self.SLOT
+                row += 1
+            y += self.LANE_HEADER + size * self.SLOT
+        
+        for row in range(row, len(rows)):
+            self.row_tops.append(y + DragDropCard.SPACING // 2)
+            y += self.SLOT
+        self.lanes_end = y
+        return rows
+    
+    def draw_lanes(self):
+        self.cards_canvas.delete('lane')
+        if self.row_tops is None:
+            return
+        
+        for name, y in self.lane_tops:
+            self.cards_canvas.create_rectangle(2, y + 3, self.canvas_width - 2, y + self.LANE_HEADER - 2,
+                                               fill=avatar_color(name), outline='', tags='lane')
+            label = f"@{name}" if name else "Non assigné"
+            count = self.app.board.column_assignee_count(self.column, name)
+            self.cards_canvas.create_text(8, y + self.LANE_HEADER // 2, text=f"{label} ({count})", anchor='w',
+                                          fill='white', font=('Arial', 8, 'bold'), tags='lane')
+        self.cards_canvas.tag_lower('lane')
+    
+    def sync_cards(self):
+        self.filter_rows()
+        self.draw_lanes()
+        self.update_header()
+        self.update_scrollregion()
+        self.render_cards()
+    
+    def show_placeholder(self, index):
+        if self.placeholder is None:
+            self.placeholder = DropPlaceholder(self.cards_canvas)
+            self.placeholder_item = self.cards_canvas.create_window(3, 0, window=self.placeholder, anchor='nw',
+                                                                    width=self.card_width(),
+                                                                    height=DragDropCard.HEIGHT)
+        
+        self.placeholder_index = index
+        self.cards_canvas.itemconfigure(self.placeholder_item, state='normal')
+        self.cards_canvas.coords(self.placeholder_item, 3, self.slot_y(index))
+        self.update_scrollregion()
+        self.render_cards()
+    
+    def hide_placeholder(self):
+        if self.placeholder_index is None:
+            return
+        
+        self.placeholder_index = None
+        self.cards_canvas.itemconfigure(self.placeholder_item, state='hidden')
+        self.update_scrollregion()
+        self.render_cards()
+
+class BoardSlot:
+    STATE = ('board', 'board_path', 'journal', 'dirty', 'version', 'saved_version',
+             'board_frame', 'column_frames', 'dirty_columns', 'col_width')
+    
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self.state = None
+        self.view = None
+    
+    def stash(self, app):
+        # Tableau en cache: son index de recherche sera reconstruit au premier filtre
+        app.board.disable_search()
+        self.state = {name: getattr(app, name) for name in self.STATE}
+        self.view = (app.filter_query, app.swimlanes)
+    
+    def restore(self, app):
+        for name, value in self.state.items():
+            setattr(app, name, value)
+        self.state = None
 
 class EnhancedKanbanApp:
-    def __init__(self, root):
+    LOAD_SLICE = 0.012
+    IMPORT_BATCH = 500
+    SYNC_POLL = 50
+    BOARD_EXTENSIONS = ('.json', '.kbs')
+    CARD_FILETYPES = [('CSV', '*.csv'), ('JSON Lines', '*.jsonl'), ('All files', '*.*')]
+    
+    def __init__(self, root, virtual=False, renderer='widgets', activity_capacity=1000,
+                 history_path="enhanced_kanban_activity.log", board_path="enhanced_kanban.json",
+                 autosave_delay=None, journal=True, compact_every=500, storage='json',
+                 db_path="enhanced_kanban.db", swimlanes=False, boards_dir=None, board_cache=3,
+                 profiler=None, sync_url=None):
         self.root = root
+        self.profiler = profiler
+        if sync_url:
+            # Copie locale du tableau partagé: le tableau personnel n'est jamais écrasé par celui du serveur
+            base, extension = os.path.splitext(board_path)
+            board_path = f"{base}.sync{extension}"
+        self.board_path = board_path
+        self.store = SQLiteBoardStore(db_path) if storage == 'sqlite' else None
+        self.use_journal = journal and self.store is None
+        self.compact_every = compact_every
+        self.journal = BoardJournal(board_path, compact_every=compact_every) \
+            if self.use_journal and boards_dir is None else None
+        self.boards_dir = boards_dir
+        self.board_cache = board_cache
+        self.slots = OrderedDict()
+        self.current_slot = None
+        self.saver = BackgroundSaver()
+        self.dirty = False
+        self.version = 0
+        self.saved_version = 0
+        self.autosave_delay = autosave_delay
+        self.autosave_job = None
+        self.save_poll_job = None
+        self.loader = None
+        self.loading = None
+        self.load_job = None
+        self.filter_query = ""
+        self.card_filter = None
+        self.filter_job = None
+        self.swimlanes = swimlanes
+        self.lanes = None
+        self.selection = set()
+        self.sync = None
+        self.sync_job = None
+        self.virtual = virtual
+        self.renderer = renderer
         self.root.title("🚀 Enhanced Kanban Board")
         self.root.geometry("1600x900")
         self.root.configure(bg='#ecf0f1')
         
-        self.activity_log = ActivityLog()
-        self.columns = [
-            KanbanColumn("📋 Backlog", is_backlog=True),
-            KanbanColumn("📝 À faire"),
-            KanbanColumn("⚡ En cours"),
-            KanbanColumn("🔍 Révision"),
-            KanbanColumn("✅ Terminé")
-        ]
+        if self.store:
+            history = self.store.activity_history()
+        else:
+            history = ActivityHistory(history_path) if history_path else None
+        self.activity_log = ActivityLog(activity_capacity, history)
+        self.board = BoardModel.default()
         
         self.column_frames = []
+        self.dirty_columns = set()
+        self.drop_geometry = None
+        self.col_width = None
+        self.relayout_job = None
+        self.root_size = None
         self.setup_ui()
-        self.refresh_board()
         
-        if os.path.exists("enhanced_kanban.json"):
-            self.load_board()
+        if self.boards_dir:
+            names = self.list_boards()
+            initial = os.path.splitext(os.path.basename(board_path))[0]
+            self.open_board(initial if initial in names or not names else names[0])
+        elif self.store:
+            self.load_stored_board()
+        elif self.journal:
+            self.load_journaled_board()
+        else:
+            self.refresh_board()
+            if os.path.exists(self.board_path) and not sync_url:
+                self.load_board()
+        
+        if sync_url:
+            self.connect_sync(sync_url)
+    
+    @property
+    def columns(self):
+        return self.board.columns
     
     def setup_ui(self):
         main_container = tk.Frame(self.root, bg='#ecf0f1')
         main_container.pack(fill='both', expand=True)
         
         self.activity_panel = ResizableActivityPanel(main_container, self.activity_log)
+        if self.profiler:
+            self.performance_panel = PerformancePanel(main_container, self.profiler)
         
         kanban_frame = tk.Frame(main_container, bg='#ecf0f1')
         kanban_frame.pack(side='left', fill='both', expand=True)
+        self.kanban_frame = kanban_frame
         
         toolbar = tk.Frame(kanban_frame, bg='#2c3e50', height=60)
         toolbar.pack(fill='x')
@@ -532,6 +1323,29 @@ class EnhancedKanbanApp:
         tk.Label(toolbar_content, text="🚀 Enhanced Kanban", 
                 font=('Arial', 14, 'bold'), bg='#2c3e50', fg='white').pack(side='left')
         
+        if self.boards_dir:
+            boards_frame = tk.Frame(toolbar_content, bg='#2c3e50')
+            boards_frame.pack(side='left', padx=(20, 0))
+            self.board_picker = ttk.Combobox(boards_frame, state='readonly', width=20)
+            self.board_picker.pack(side='left')
+            self.board_picker.bind('<<ComboboxSelected>>', lambda e: self.open_board(self.board_picker.get()))
+            tk.Button(boards_frame, text="➕", font=('Arial', 9, 'bold'), bg='#27ae60', fg='white',
+                     relief='flat', command=self.create_board).pack(side='left', padx=3)
+        
+        search_frame = tk.Frame(toolbar_content, bg='#2c3e50')
+        search_frame.pack(side='left', padx=(20, 0))
+        tk.Label(search_frame, text="🔍", font=('Arial', 11), bg='#2c3e50', fg='white').pack(side='left')
+        
+        self.filter_var = tk.StringVar()
+        self.filter_entry = tk.Entry(search_frame, textvariable=self.filter_var, width=28,
+                                     font=('Arial', 10), relief='flat')
+        self.filter_entry.pack(side='left', padx=4, ipady=3)
+        self.filter_entry.bind('<Escape>', lambda e: self.filter_var.set(""))
+        self.filter_var.trace_add('write', lambda *args: self.schedule_filter())
+        
+        self.load_progress = ttk.Progressbar(toolbar_content, length=160, mode='determinate', maximum=100)
+        self.load_label = tk.Label(toolbar_content, font=('Arial', 9), bg='#2c3e50', fg='#bdc3c7')
+        
         btn_frame = tk.Frame(toolbar_content, bg='#2c3e50')
         btn_frame.pack(side='right')
         
@@ -539,6 +1353,11 @@ class EnhancedKanbanApp:
                  bg='#27ae60', fg='white', padx=12, pady=6, relief='flat',
                  command=self.add_card_to_backlog).pack(side='left', padx=3)
         
+        self.lanes_btn = tk.Button(btn_frame, text="👥 Couloirs", font=('Arial', 9, 'bold'),
+                                   bg='#e67e22' if self.swimlanes else '#7f8c8d', fg='white', padx=12, pady=6,
+                                   relief='flat', command=self.toggle_swimlanes)
+        self.lanes_btn.pack(side='left', padx=3)
+        
         tk.Button(btn_frame, text="💾 Sauvegarder", font=('Arial', 9, 'bold'),
                  bg='#3498db', fg='white', padx=12, pady=6, relief='flat',
                  command=self.save_board).pack(side='left', padx=3)
@@ -547,6 +1366,26 @@ class EnhancedKanbanApp:
                  bg='#9b59b6', fg='white', padx=12, pady=6, relief='flat',
                  command=self.load_board).pack(side='left', padx=3)
         
+        tk.Button(btn_frame, text="📥 Importer", font=('Arial', 9, 'bold'),
+                 bg='#16a085', fg='white', padx=12, pady=6, relief='flat',
+                 command=self.import_cards).pack(side='left', padx=3)
+        
+        tk.Button(btn_frame, text="📤 Exporter", font=('Arial', 9, 'bold'),
+                 bg='#16a085', fg='white', padx=12, pady=6, relief='flat',
+                 command=self.show_export_menu).pack(side='left', padx=3)
+        
+        self.selection_bar = tk.Frame(kanban_frame, bg='#fdebd0', pady=4)
+        self.selection_label = tk.Label(self.selection_bar, font=('Arial', 9, 'bold'), bg='#fdebd0', fg='#2c3e50')
+        self.selection_label.pack(side='left', padx=10)
+        
+        for text, color, command in (("✖ Désélectionner", '#95a5a6', self.clear_selection),
+                                     ("🗑 Supprimer", '#e74c3c', self.bulk_delete),
+                                     ("🎨 Couleur", '#9b59b6', self.bulk_recolor),
+                                     ("👤 Réassigner", '#16a085', self.bulk_reassign),
+                                     ("➡ Déplacer", '#2980b9', self.show_bulk_move_menu)):
+            tk.Button(self.selection_bar, text=text, font=('Arial', 8, 'bold'), bg=color, fg='white',
+                     relief='flat', padx=8, command=command).pack(side='right', padx=3)
+        
         self.board_frame = tk.Frame(kanban_frame, bg='#ecf0f1')
         self.board_frame.pack(fill='both', expand=True, padx=10, pady=10)
     
@@ -555,115 +1394,144 @@ class EnhancedKanbanApp:
             widget.destroy()
         
         self.column_frames = []
+        self.dirty_columns = set()
+        # Le tableau affiché garde son index de recherche: le premier filtre ne le construit pas
+        self.board.enable_search()
+        self.card_filter = self.board.search(self.filter_query) if self.filter_query else None
+        self.lanes = self.compute_lanes()
         
         self.root.update_idletasks()
+        self.col_width = self.compute_column_width()
+        
+        for i, column in enumerate(self.columns):
+            self.create_column(column, i, self.col_width)
+    
+    def compute_column_width(self):
         available_width = self.board_frame.winfo_width() - 50
         if available_width <= 0:
             available_width = 1200
         
-        col_width = max(200, (available_width - (len(self.columns) * 15)) // len(self.columns))
+        column_count = max(1, len(self.columns))
+        return max(200, (available_width - (column_count * 15)) // column_count)
+    
+    def schedule_relayout(self, event=None):
+        if event is not None:
+            size = (event.width, event.height)
+            if size == self.root_size:
+                return
+            self.root_size = size
+        
+        if self.relayout_job:
+            self.root.after_cancel(self.relayout_job)
+        self.relayout_job = self.root.after(120, self.relayout)
+    
+    def relayout(self):
+        self.relayout_job = None
+        col_width = self.compute_column_width()
+        if col_width == self.col_width:
+            return
         
-        for i, column in enumerate(self.columns):
-            self.create_column(column, i, col_width)
+        self.col_width = col_width
+        for col_frame in self.column_frames:
+            col_frame.configure(width=col_width)
+        if self.drop_geometry:
+            self.drop_geometry.invalidate()
     
     def create_column(self, column, col_index, col_width):
-        col_frame = tk.Frame(self.board_frame, 
-                            bg='#3498db' if column.is_backlog else '#95a5a6', 
-                            relief='solid', borderwidth=2, 
-                            width=col_width, height=750)
+        col_frame = ColumnFrame(self.board_frame, self, column, col_index, col_width)
         col_frame.grid(row=0, column=col_index, padx=8, pady=0, sticky='ns')
-        col_frame.grid_propagate(False)
         
         self.board_frame.grid_columnconfigure(col_index, weight=1)
         
         self.column_frames.append(col_frame)
+        return col_frame
+    
+    def mark_dirty(self, *columns):
+        self.dirty_columns.update(columns)
+    
+    def update_board(self):
+        frames_by_column = {col_frame.column: col_frame for col_frame in self.column_frames}
+        if len(frames_by_column) != len(self.columns) or \
+                any(column not in frames_by_column for column in self.columns):
+            self.refresh_board()
+            return
         
-        header = tk.Frame(col_frame, 
-                         bg='#2980b9' if column.is_backlog else '#7f8c8d', 
-                         height=70)
-        header.pack(fill='x')
-        header.pack_propagate(False)
-        
-        title_text = column.name.replace(' ', '\n') if len(column.name) > 10 else column.name
-        title_label = tk.Label(header, text=f"{title_text}\n({len(column.cards)})", 
-                              font=('Arial', 10, 'bold'), 
-                              bg='#2980b9' if column.is_backlog else '#7f8c8d', 
-                              fg='white', justify='center')
-        title_label.pack(expand=True)
-        
-        if not column.is_backlog:
-            btn_frame = tk.Frame(header, bg='#7f8c8d')
-            btn_frame.pack(side='bottom', fill='x')
-            
-            if col_index > 1:
-                left_btn = tk.Button(btn_frame, text="◀", width=3, height=1,
-                                   bg='white', font=('Arial', 7),
-                                   command=lambda: self.move_column_left(col_index))
-                left_btn.pack(side='left', padx=1)
-            
-            if col_index < len(self.columns) - 1:
-                right_btn = tk.Button(btn_frame, text="▶", width=3, height=1,
-                                    bg='white', font=('Arial', 7),
-                                    command=lambda: self.move_column_right(col_index))
-                right_btn.pack(side='left', padx=1)
-        
-        cards_container_frame = tk.Frame(col_frame, bg='white')
-        cards_container_frame.pack(fill='both', expand=True, padx=3, pady=3)
-        
-        cards_canvas = tk.Canvas(cards_container_frame, bg='white', highlightthickness=0)
-        cards_scroll = tk.Scrollbar(cards_container_frame, orient='vertical', 
-                                   command=cards_canvas.yview, width=12)
-        cards_canvas.configure(yscrollcommand=cards_scroll.set)
-        
-        cards_canvas.pack(side='left', fill='both', expand=True)
-        cards_scroll.pack(side='right', fill='y')
-        
-        cards_frame = tk.Frame(cards_canvas, bg='white')
-        cards_canvas.create_window((0, 0), window=cards_frame, anchor='nw')
-        
-        for card_index, card in enumerate(column.cards):
-            card_widget = DragDropCard(cards_frame, card, self, col_index, card_index)
-            card_widget.pack(fill='x', pady=4, padx=3)
-        
-        if column.is_backlog:
-            add_btn = tk.Button(cards_frame, text="➕ Nouvelle carte", 
-                               font=('Arial', 9, 'bold'),
-                               bg='#27ae60', fg='white', pady=6, relief='flat',
-                               command=self.add_card_to_backlog)
-            add_btn.pack(fill='x', pady=8, padx=5)
-        
-        def configure_scroll(event):
-            cards_canvas.configure(scrollregion=cards_canvas.bbox("all"))
-        
-        cards_frame.bind('<Configure>', configure_scroll)
-        cards_canvas.bind('<MouseWheel>', lambda e: cards_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+        self.column_frames = [frames_by_column[column] for column in self.columns]
+        if self.filter_query and self.dirty_columns:
+            self.card_filter = self.board.search(self.filter_query)
+        if self.swimlanes and self.dirty_columns:
+            lanes = self.compute_lanes()
+            if lanes != self.lanes:
+                self.lanes = lanes
+                self.dirty_columns.update(self.columns)
+        for col_index, col_frame in enumerate(self.column_frames):
+            if col_frame.col_index != col_index:
+                col_frame.set_index(col_index)
+            if col_frame.column in self.dirty_columns:
+                col_frame.sync_cards()
+        
+        self.dirty_columns = set()
+    
+    def schedule_filter(self):
+        if self.filter_job:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(150, self.apply_filter)
+    
+    def apply_filter(self):
+        self.filter_job = None
+        query = self.filter_var.get()
+        if query == self.filter_query:
+            return
         
-        def configure_canvas_width(event):
-            canvas_width = event.width
-            cards_canvas.itemconfig(cards_canvas.winfo_children()[0], width=canvas_width)
+        self.filter_query = query
+        self.card_filter = self.board.search(query) if query else None
+        self.lanes = self.compute_lanes()
+        self.sync_all_columns()
+    
+    def sync_all_columns(self):
+        for col_frame in self.column_frames:
+            col_frame.sync_cards()
+        if self.drop_geometry:
+            self.drop_geometry.invalidate()
+    
+    def compute_lanes(self):
+        if not self.swimlanes:
+            return None
         
-        cards_canvas.bind('<Configure>', configure_canvas_width)
+        if self.card_filter is None:
+            counts = self.board.assignee_counts
+        else:
+            counts = {}
+            for card_id in self.card_filter:
+                column, card = self.board.index[card_id]
+                key = (column, card.assigned_to)
+                counts[key] = counts.get(key, 0) + 1
+        
+        sizes = {}
+        for (column, name), count in counts.items():
+            sizes[name] = max(sizes.get(name, 0), count)
+        return sorted(sizes.items(), key=lambda lane: (lane[0] == "", lane[0].casefold()))
+    
+    def toggle_swimlanes(self):
+        self.swimlanes = not self.swimlanes
+        self.lanes_btn.configure(bg='#e67e22' if self.swimlanes else '#7f8c8d')
+        self.lanes = self.compute_lanes()
+        self.sync_all_columns()
     
     def move_column_left(self, col_index):
         if col_index > 1:
-            self.columns[col_index], self.columns[col_index-1] = \
-                self.columns[col_index-1], self.columns[col_index]
+            self.apply_op({'op': 'move_column', 'from': col_index, 'to': col_index-1})
             self.activity_panel.add_activity(f"Colonne '{self.columns[col_index-1].name}' déplacée ←")
-            self.refresh_board()
+            self.update_board()
     
     def move_column_right(self, col_index):
         if col_index < len(self.columns) - 1:
-            self.columns[col_index], self.columns[col_index+1] = \
-                self.columns[col_index+1], self.columns[col_index]
+            self.apply_op({'op': 'move_column', 'from': col_index, 'to': col_index+1})
             self.activity_panel.add_activity(f"Colonne '{self.columns[col_index+1].name}' déplacée →")
-            self.refresh_board()
+            self.update_board()
     
     def add_card_to_backlog(self):
-        backlog_col = None
-        for col in self.columns:
-            if col.is_backlog:
-                backlog_col = col
-                break
+        backlog_col = self.board.backlog()
         
         if not backlog_col:
             messagebox.showerror("Erreur", "Pas de backlog trouvé")
@@ -673,13 +1541,77 @@ class EnhancedKanbanApp:
         self.root.wait_window(dialog.window)
         
         if dialog.result:
-            backlog_col.cards.append(dialog.result)
+            self.apply_op({'op': 'add_card', 'column': self.board.column_index(backlog_col), 
+                           'card': dialog.result.to_dict()})
             assigned_text = f" → @{dialog.result.assigned_to}" if dialog.result.assigned_to else ""
             self.activity_panel.add_activity(f"✨ Nouvelle carte '{dialog.result.title}'{assigned_text}")
-            self.refresh_board()
+            self.update_board()
     
-    def edit_card(self, col_index, card_index):
-        card = self.columns[col_index].cards[card_index]
+    def import_cards(self):
+        from tkinter import filedialog
+        
+        backlog_col = self.board.backlog()
+        if not backlog_col:
+            messagebox.showerror("Erreur", "Pas de backlog trouvé")
+            return
+        if self.loader is not None:
+            messagebox.showinfo("Import", "Chargement en cours, réessayez une fois le tableau chargé")
+            return
+        
+        filename = filedialog.askopenfilename(filetypes=self.CARD_FILETYPES)
+        if not filename:
+            return
+        
+        # Lecture ligne à ligne et une opération par lot: un seul lot en mémoire, un seul rendu à la fin
+        column = self.board.column_index(backlog_col)
+        report = ImportReport()
+        error = None
+        try:
+            for batch in card_batches(filename, report, self.IMPORT_BATCH):
+                self.apply_op({'op': 'batch', 'ops': [{'op': 'add_card', 'column': column, 'card': card.to_dict()}
+                                                      for card in batch]})
+                report.imported += len(batch)
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            error = e
+        
+        if report.imported:
+            self.activity_panel.add_activity(f"📥 {report.imported} cartes importées depuis {os.path.basename(filename)}")
+            self.update_board()
+        
+        details = "\n".join(report.errors[:10])
+        if error is not None:
+            messagebox.showerror("Erreur", f"Import interrompu après {report.imported} cartes:\n{str(error)}")
+        elif report.skipped:
+            messagebox.showwarning("Import", f"{report.imported} cartes importées, {report.skipped} lignes ignorées:\n{details}")
+        else:
+            messagebox.showinfo("Import", f"{report.imported} cartes importées")
+    
+    def show_export_menu(self):
+        menu = tk.Menu(self.root, tearoff=0)
+        menu.add_command(label="Tout le tableau", command=self.export_cards)
+        menu.add_separator()
+        for col_index, column in enumerate(self.columns):
+            menu.add_command(label=column.name, command=lambda i=col_index: self.export_cards(i))
+        menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
+    
+    def export_cards(self, col_index=None):
+        from tkinter import filedialog
+        
+        columns = self.columns if col_index is None else [self.columns[col_index]]
+        filename = filedialog.asksaveasfilename(defaultextension='.csv', initialfile="kanban_cartes.csv",
+                                                filetypes=self.CARD_FILETYPES)
+        if not filename:
+            return
+        
+        try:
+            count = write_cards(filename, columns)
+        except OSError as e:
+            messagebox.showerror("Erreur", f"Erreur d'export:\n{str(e)}")
+            return
+        self.activity_panel.add_activity(f"📤 {count} cartes exportées → {os.path.basename(filename)}")
+    
+    def edit_card(self, card_id):
+        card = self.board.get_card(card_id)
         old_title = card.title
         old_assigned = card.assigned_to
         
@@ -687,123 +1619,712 @@ class EnhancedKanbanApp:
         self.root.wait_window(dialog.window)
         
         if dialog.result:
-            self.columns[col_index].cards[card_index] = dialog.result
+            self.apply_op({'op': 'update_card', 'id': card_id, 'fields': {
+                'title': dialog.result.title,
+                'description': dialog.result.description,
+                'assigned_to': dialog.result.assigned_to,
+                'color': dialog.result.color
+            }})
             changes = []
-            if old_title != dialog.result.title:
-                changes.append(f"titre: '{dialog.result.title}'")
-            if old_assigned != dialog.result.assigned_to:
-                changes.append(f"assigné: @{dialog.result.assigned_to}")
+            if old_title != card.title:
+                changes.append(f"titre: '{card.title}'")
+            if old_assigned != card.assigned_to:
+                changes.append(f"assigné: @{card.assigned_to}")
             
             change_text = " (" + ", ".join(changes) + ")" if changes else ""
             self.activity_panel.add_activity(f"✏ Carte modifiée{change_text}")
-            self.refresh_board()
+            self.update_board()
     
-    def delete_card(self, col_index, card_index):
-        card = self.columns[col_index].cards[card_index]
+    def delete_card(self, card_id):
+        card = self.board.get_card(card_id)
         if messagebox.askyesno("Confirmer", f"Supprimer '{card.title}' ?"):
-            self.columns[col_index].cards.pop(card_index)
+            self.apply_op({'op': 'delete_card', 'id': card_id})
             self.activity_panel.add_activity(f"🗑 Carte '{card.title}' supprimée")
-            self.refresh_board()
+            if card_id in self.selection:
+                self.selection.discard(card_id)
+                self.update_selection_bar()
+            self.update_board()
     
-    def move_card(self, from_col, card_index, to_col):
-        card = self.columns[from_col].cards.pop(card_index)
-        self.columns[to_col].cards.append(card)
+    def move_card(self, card_id, to_col, index=None):
+        if card_id in self.selection and len(self.selection) > 1:
+            self.bulk_move(to_col, index)
+            return
         
-        from_name = self.columns[from_col].name
-        to_name = self.columns[to_col].name
-        assigned_text = f" (@{card.assigned_to})" if card.assigned_to else ""
+        from_column, card = self.board.find(card_id)
+        to_column = self.columns[to_col]
+        op = {'op': 'move_card', 'id': card_id, 'to': to_col}
+        if index is not None:
+            rows = self.column_frames[to_col].rows
+            if from_column is to_column and card in rows[max(0, index - 1):index + 1]:
+                return
+            ranks = self.drop_ranks(to_col, index, [card])
+            if ranks:
+                op['rank'] = ranks[0]
+        if from_column is to_column and 'rank' not in op:
+            return
+        
+        self.apply_op(op)
         
-        self.activity_panel.add_activity(f"🔄 '{card.title}': {from_name} → {to_name}{assigned_text}")
+        if from_column is to_column:
+            self.activity_panel.add_activity(f"↕ '{card.title}' réordonnée dans {to_column.name}")
+        else:
+            assigned_text = f" (@{card.assigned_to})" if card.assigned_to else ""
+            self.activity_panel.add_activity(f"🔄 '{card.title}': {from_column.name} → {to_column.name}{assigned_text}")
+        self.update_board()
+    
+    def drop_ranks(self, to_col, index, cards):
+        # index compte les lignes affichées (filtre et couloirs compris); les cartes déplacées ne servent pas de repère
+        moving = {card.id for card in cards}
+        rows = self.column_frames[to_col].rows
+        column = self.columns[to_col]
+        for position in range(min(index, len(rows)) - 1, -1, -1):
+            if rows[position].id not in moving:
+                return self.board.ranks_beside(column, rows[position], len(cards), skip=moving)
+        for position in range(index, len(rows)):
+            if rows[position].id not in moving:
+                return self.board.ranks_beside(column, rows[position], len(cards), before=True, skip=moving)
+        return None
+    
+    def toggle_selection(self, card_id):
+        if card_id in self.selection:
+            self.selection.discard(card_id)
+        else:
+            self.selection.add(card_id)
+        self.mark_dirty(self.board.column_of(card_id))
+        self.update_board()
+        self.update_selection_bar()
+    
+    def clear_selection(self):
+        if not self.selection:
+            return
+        
+        for card_id in self.selection:
+            found = self.board.find(card_id)
+            if found:
+                self.mark_dirty(found[0])
+        self.selection = set()
+        self.update_board()
+        self.update_selection_bar()
+    
+    def update_selection_bar(self):
+        if self.selection:
+            count = len(self.selection)
+            plural = 's' if count > 1 else ''
+            self.selection_label.configure(text=f"{count} carte{plural} sélectionnée{plural}")
+            self.selection_bar.pack(fill='x', padx=10, pady=(8, 0), before=self.board_frame)
+        else:
+            self.selection_bar.pack_forget()
+    
+    def selected_cards(self):
+        # Dans l'ordre du tableau, pour que les cartes déplacées gardent leur ordre relatif
+        return [(column, card) for column in self.columns for card in column.cards if card.id in self.selection]
+    
+    def apply_batch(self, ops, message):
+        if not ops:
+            return
+        
+        self.apply_op({'op': 'batch', 'ops': ops})
+        self.activity_panel.add_activity(message)
+        self.update_board()
+    
+    def show_bulk_move_menu(self):
+        menu = tk.Menu(self.root, tearoff=0)
+        for col_index, column in enumerate(self.columns):
+            if not column.is_backlog:
+                menu.add_command(label=column.name, command=lambda i=col_index: self.bulk_move(i))
+        menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
+    
+    def bulk_move(self, to_col, index=None):
+        # Sans point de dépôt, les cartes vont en fin de colonne; avec, elles y sont insérées dans leur ordre
+        to_column = self.columns[to_col]
+        cards = [card for column, card in self.selected_cards()
+                 if (index is not None or column is not to_column) and (column.is_backlog or not to_column.is_backlog)]
+        ranks = self.drop_ranks(to_col, index, cards) if index is not None and cards else None
+        ops = []
+        for position, card in enumerate(cards):
+            op = {'op': 'move_card', 'id': card.id, 'to': to_col}
+            if ranks:
+                op['rank'] = ranks[position]
+            ops.append(op)
+        self.apply_batch(ops, f"🔄 {len(ops)} cartes → {to_column.name}")
+    
+    def bulk_delete(self):
+        cards = self.selected_cards()
+        if not cards or not messagebox.askyesno("Confirmer", f"Supprimer {len(cards)} cartes ?"):
+            return
+        
+        self.selection = set()
+        self.apply_batch([{'op': 'delete_card', 'id': card.id} for column, card in cards],
+                         f"🗑 {len(cards)} cartes supprimées")
+        self.update_selection_bar()
+    
+    def bulk_reassign(self):
+        cards = self.selected_cards()
+        if not cards:
+            return
+        
+        name = simpledialog.askstring("Réassigner", f"Assigner {len(cards)} cartes à :", parent=self.root)
+        if name is None:
+            return
+        
+        name = name.strip()
+        ops = [{'op': 'update_card', 'id': card.id, 'fields': {'assigned_to': name}}
+               for column, card in cards if card.assigned_to != name]
+        self.apply_batch(ops, f"👤 {len(ops)} cartes assignées à @{name}" if name else f"👤 {len(ops)} cartes désassignées")
+    
+    def bulk_recolor(self):
+        cards = self.selected_cards()
+        if not cards:
+            return
+        
+        color = colorchooser.askcolor(title="Couleur des cartes", parent=self.root)[1]
+        if not color:
+            return
+        
+        ops = [{'op': 'update_card', 'id': card.id, 'fields': {'color': color}}
+               for column, card in cards if card.color != color]
+        self.apply_batch(ops, f"🎨 {len(ops)} cartes recolorées")
+    
+    def apply_op(self, op, remote=False):
+        columns = self.board.apply(op)
+        if self.sync and not remote:
+            self.sync.send(op)
+        # Pendant un chargement, le tableau complet est persisté une fois terminé
+        if self.loader is None:
+            if self.store:
+                self.store.record(op, self.board)
+            elif self.journal:
+                self.journal.record(op)
+        self.changed()
+        self.mark_dirty(*columns)
+        
+        if self.journal and self.journal.should_compact() and not self.saver.busy():
+            self.save_board(quiet=True)
+        return columns
+    
+    def changed(self):
+        self.version += 1
+        if self.store:
+            return
+        self.dirty = True
+        if self.autosave_delay:
+            if self.autosave_job:
+                self.root.after_cancel(self.autosave_job)
+            self.autosave_job = self.root.after(self.autosave_delay, self.autosave)
+    
+    def autosave(self):
+        self.autosave_job = None
+        self.save_board(quiet=True)
+    
+    def save_board(self, quiet=False, callback=None):
+        if self.loader:
+            # Le tableau est incomplet: le sauvegarder tronquerait le fichier
+            if callback:
+                messagebox.showinfo("Sauvegarde", "Chargement en cours: fermeture annulée, réessayez une fois le tableau chargé")
+            elif not quiet:
+                messagebox.showinfo("Sauvegarde", "Chargement en cours, réessayez une fois le tableau chargé")
+            return
+        
+        if not self.dirty and self.store is None:
+            if callback:
+                callback()
+            elif not quiet:
+                messagebox.showinfo("Sauvegarde", "Aucune modification à sauvegarder")
+            return
+        
+        self.submit_save(self.board, self.board_path, self.journal, self.version,
+                         lambda error: self.on_saved(error, quiet, callback))
+    
+    def submit_save(self, board, path, journal, version, on_saved):
+        journal_seq = journal.seq if journal else None
+        snapshot = snapshot_board(board, self.activity_log.activities, journal_seq)
+        
+        def done(error):
+            if error is None and journal_seq is not None:
+                journal.truncate_through(journal_seq)
+            on_saved(error)
+        
+        self.saver.submit(path, snapshot, version, done)
+        # Une seule boucle de suivi, même pour des sauvegardes rapprochées
+        if self.save_poll_job is None:
+            self.poll_saves()
+    
+    def poll_saves(self):
+        if self.save_poll_job is not None:
+            self.root.after_cancel(self.save_poll_job)
+            self.save_poll_job = None
+        for path, version, error, callbacks in self.saver.poll():
+            if error is None:
+                self.mark_saved(path, version)
+            for callback in callbacks:
+                callback(error)
+        
+        # Un rappel a pu relancer une sauvegarde et déjà reprogrammer le suivi
+        if self.save_poll_job is None and (self.saver.busy() or not self.saver.results.empty()):
+            self.save_poll_job = self.root.after(50, self.poll_saves)
+    
+    def mark_saved(self, path, version):
+        if path == self.board_path:
+            self.saved_version = max(self.saved_version, version)
+            self.dirty = self.version != self.saved_version
+            return
+        
+        for slot in self.slots.values():
+            if slot.path == path and slot.state is not None:
+                slot.state['saved_version'] = max(slot.state['saved_version'], version)
+                slot.state['dirty'] = slot.state['version'] != slot.state['saved_version']
+    
+    def on_saved(self, error, quiet, callback):
+        if error is not None:
+            messagebox.showerror("Erreur", f"Erreur de sauvegarde:\n{str(error)}")
+            return
+        
+        if not quiet:
+            self.activity_panel.add_activity("💾 Tableau sauvegardé")
+            messagebox.showinfo("Succès", "Tableau sauvegardé avec succès !")
+        if callback:
+            callback()
+    
+    def load_journaled_board(self):
+        try:
+            self.board, activities = self.journal.load()
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur de chargement:\n{str(e)}")
+            activities = None
+        
+        if activities is not None:
+            self.activity_log.activities = activities
+            self.activity_panel.refresh()
+        if self.journal.pending:
+            self.dirty = True
         self.refresh_board()
     
-    def save_board(self):
+    def list_boards(self):
+        names = set()
+        for filename in os.listdir(self.boards_dir):
+            name, extension = os.path.splitext(filename)
+            if extension.lower() in self.BOARD_EXTENSIONS:
+                names.add(name)
+        return sorted(names, key=str.casefold)
+    
+    def board_file(self, name):
+        for extension in self.BOARD_EXTENSIONS:
+            path = os.path.join(self.boards_dir, name + extension)
+            if os.path.exists(path):
+                return path
+        return os.path.join(self.boards_dir, name + self.BOARD_EXTENSIONS[0])
+    
+    def open_board(self, name):
+        if self.loader or (self.current_slot and self.current_slot.name == name):
+            return
+        
+        self.clear_selection()
+        
+        if name not in self.slots:
+            # Un tableau tout juste évincé peut encore être en cours d'écriture
+            self.saver.join()
+            self.poll_saves()
+        
+        if self.current_slot:
+            if self.autosave_job and self.dirty:
+                self.save_board(quiet=True)
+            self.current_slot.stash(self)
+            self.board_frame.pack_forget()
+        
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slots[name] = BoardSlot(name, self.board_file(name))
+            if self.current_slot is not None:
+                self.board_frame = tk.Frame(self.kanban_frame, bg='#ecf0f1')
+            self.board_frame.pack(fill='both', expand=True, padx=10, pady=10)
+            self.board_path = slot.path
+            self.journal = BoardJournal(slot.path, compact_every=self.compact_every) if self.use_journal else None
+            self.dirty = False
+            self.version = 0
+            self.saved_version = 0
+            self.load_slot_board()
+        else:
+            slot.restore(self)
+            self.board_frame.pack(fill='both', expand=True, padx=10, pady=10)
+            self.card_filter = self.board.search(self.filter_query) if self.filter_query else None
+            self.lanes = self.compute_lanes()
+            if self.filter_query or self.swimlanes or slot.view != (self.filter_query, self.swimlanes):
+                self.sync_all_columns()
+            self.root.update_idletasks()
+            self.relayout()
+        
+        self.slots.move_to_end(name)
+        self.current_slot = slot
+        self.root.title(f"🚀 Enhanced Kanban Board — {name}")
+        self.board_picker.configure(values=sorted(set(self.list_boards()) | set(self.slots), key=str.casefold))
+        self.board_picker.set(name)
+        
+        while len(self.slots) > self.board_cache:
+            self.evict_board(next(iter(self.slots.values())))
+    
+    def load_slot_board(self):
         try:
-            data = {
-                'columns': [],
-                'activities': self.activity_log.activities,
-                'saved_at': datetime.now().isoformat()
-            }
-            
-            for col in self.columns:
-                col_data = {
-                    'name': col.name,
-                    'is_backlog': col.is_backlog,
-                    'cards': []
-                }
-                for card in col.cards:
-                    card_data = {
-                        'title': card.title,
-                        'description': card.description,
-                        'assigned_to': card.assigned_to,
-                        'color': card.color,
-                        'id': card.id
-                    }
-                    col_data['cards'].append(card_data)
-                data['columns'].append(col_data)
-            
-            with open("enhanced_kanban.json", 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if self.journal:
+                self.board, activities = self.journal.load()
+                self.dirty = self.journal.pending > 0
+            elif os.path.exists(self.board_path):
+                self.board, activities = board_from_dict(read_snapshot(self.board_path))
+            else:
+                self.board = BoardModel.default()
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur de chargement:\n{str(e)}")
+            self.board = BoardModel.default()
+        self.refresh_board()
+    
+    def evict_board(self, slot):
+        del self.slots[slot.name]
+        state = slot.state
+        slot.state = None
+        journal = state['journal']
+        if state['dirty']:
+            self.submit_save(state['board'], slot.path, journal, state['version'],
+                             lambda error: self.on_saved(error, True, journal.close if journal else None))
+        elif journal:
+            journal.close()
+        state['board_frame'].destroy()
+    
+    def create_board(self):
+        name = simpledialog.askstring("Nouveau tableau", "Nom du tableau :", parent=self.root)
+        name = (name or "").strip()
+        if not name:
+            return
+        if os.sep in name or (os.altsep and os.altsep in name):
+            messagebox.showerror("Erreur", "Le nom du tableau ne peut pas contenir de séparateur de chemin")
+            return
+        
+        exists = name in self.slots or name in self.list_boards()
+        self.open_board(name)
+        if not exists:
+            self.changed()
+            self.save_board(quiet=True)
+            self.activity_panel.add_activity(f"🗂 Nouveau tableau '{name}'")
+    
+    def unsaved(self):
+        return self.dirty or any(slot.state and slot.state['dirty'] for slot in self.slots.values())
+    
+    def save_all(self, callback):
+        if self.loader:
+            self.save_board(quiet=True, callback=callback)
+            return
+        
+        stashed = [slot for slot in self.slots.values() if slot.state and slot.state['dirty']]
+        remaining = len(stashed) + 1
+        
+        def done():
+            nonlocal remaining
+            remaining -= 1
+            if remaining == 0:
+                callback()
+        
+        for slot in stashed:
+            state = slot.state
+            self.submit_save(state['board'], slot.path, state['journal'], state['version'],
+                             lambda error: self.on_saved(error, True, done))
+        self.save_board(quiet=True, callback=done)
+    
+    def close_journals(self):
+        for slot in self.slots.values():
+            if slot.state and slot.state['journal']:
+                slot.state['journal'].close()
+        if self.journal:
+            self.journal.close()
+    
+    def connect_sync(self, url):
+        client = SyncClient(url)
+        try:
+            data = client.fetch_board()
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("Synchronisation", f"Serveur de synchronisation injoignable:\n{str(e)}")
+            return
+        
+        self.sync = SyncSession(client)
+        self.adopt_sync_board(data)
+        self.activity_panel.add_activity(f"🔗 Synchronisé avec {url} (copie locale: {os.path.basename(self.board_path)})")
+        client.start()
+        self.sync_job = self.root.after(self.SYNC_POLL, self.poll_sync)
+    
+    def close_sync(self):
+        if self.sync_job:
+            self.root.after_cancel(self.sync_job)
+            self.sync_job = None
+        if self.sync:
+            self.sync.client.close()
+    
+    def poll_sync(self):
+        self.sync_job = None
+        # Pendant un chargement ou un glisser-déposer les événements attendent: un rendu de colonne
+        # libérerait la carte glissée et fausserait la position de dépôt
+        if self.loader is None and self.drop_geometry is None:
+            remote = 0
+            while True:
+                event = self.sync.client.poll()
+                if event is None:
+                    break
+                
+                kind, payload = event
+                if kind == 'ops':
+                    remote += self.apply_sync_ops(*payload)
+                elif kind == 'reset':
+                    self.adopt_sync_board(payload)
+                    self.activity_panel.add_activity("🔗 Tableau rechargé depuis le serveur")
+                elif kind == 'rejected':
+                    seq, message = payload
+                    self.sync.rejected(seq)
+                    self.activity_panel.add_activity(f"⚠ Modification refusée par le serveur: {message}")
+                elif kind == 'error':
+                    self.activity_panel.add_activity(f"⚠ Synchronisation interrompue: {payload}")
+                else:
+                    self.activity_panel.add_activity("🔗 Synchronisation rétablie")
             
-            self.activity_panel.add_activity("💾 Tableau sauvegardé")
-            messagebox.showinfo("Succès", "Tableau sauvegardé avec succès !")
+            if remote:
+                self.selection = {card_id for card_id in self.selection if card_id in self.board}
+                self.update_selection_bar()
+                self.activity_panel.add_activity(f"🔗 {remote} modification(s) distante(s)")
+                self.update_board()
+            self.sync.resolve()
+        
+        self.sync_job = self.root.after(self.SYNC_POLL, self.poll_sync)
+    
+    def apply_sync_ops(self, epoch, entries):
+        applied = 0
+        for op in self.sync.accept(epoch, entries):
+            try:
+                self.apply_op(op, remote=True)
+            except OP_ERRORS:
+                self.sync.conflict = True
+                continue
+            applied += 1
+        return applied
+    
+    def adopt_sync_board(self, data):
+        self.board = self.sync.adopt(data)
+        self.selection = set()
+        self.update_selection_bar()
+        if self.store:
+            self.store.replace_board(self.board)
+        self.changed()
+        self.refresh_board()
+        if self.journal:
+            self.save_board(quiet=True)
+    
+    def load_stored_board(self):
+        try:
+            if not self.store.is_empty():
+                self.board = self.store.load()
+            else:
+                if os.path.exists(self.board_path):
+                    self.board, activities = board_from_dict(read_snapshot(self.board_path))
+                    if activities is not None:
+                        self.activity_log.activities = activities
+                self.store.replace_board(self.board)
         except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur de sauvegarde:\n{str(e)}")
+            messagebox.showerror("Erreur", f"Erreur de chargement:\n{str(e)}")
+        
+        self.activity_panel.refresh()
+        self.refresh_board()
     
     def load_board(self):
         from tkinter import filedialog
         
+        if self.loader:
+            return
+        if self.sync:
+            messagebox.showinfo("Chargement", "Tableau synchronisé: il ne peut pas être remplacé par un fichier")
+            return
+        
         filename = filedialog.askopenfilename(
-            initialfile="enhanced_kanban.json",
-            filetypes=[('JSON files', '*.json'), ('All files', '*.*')]
+            initialfile=os.path.basename(self.board_path),
+            filetypes=[('JSON files', '*.json'), ('Instantanés compacts', '*.kbs'), ('All files', '*.*')]
         )
         
         if not filename:
             return
         
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            self.columns = []
-            for col_data in data.get('columns', []):
-                column = KanbanColumn(col_data['name'], col_data.get('is_backlog', False))
-                for card_data in col_data.get('cards', []):
-                    card = KanbanCard(
-                        title=card_data['title'],
-                        description=card_data.get('description', ''),
-                        assigned_to=card_data.get('assigned_to', ''),
-                        color=card_data.get('color', '#ffffff')
-                    )
-                    card.id = card_data.get('id', card.id)
-                    column.cards.append(card)
-                self.columns.append(column)
-            
-            if 'activities' in data:
-                self.activity_log.activities = data['activities']
-                self.activity_panel.refresh()
+        self.clear_selection()
+        self.loading = (filename, self.board, self.version, None)
+        self.board = BoardModel()
+        self.refresh_board()
+        self.loader = BackgroundLoader(filename)
+        
+        self.load_progress['value'] = 0
+        self.load_label.configure(text="📁 Chargement… 0 %")
+        self.load_progress.pack(side='left', padx=(20, 0))
+        self.load_label.pack(side='left', padx=6)
+        self.poll_loader()
+    
+    def poll_loader(self):
+        self.load_job = None
+        deadline = time.perf_counter() + self.LOAD_SLICE
+        progress = None
+        
+        while time.perf_counter() < deadline:
+            event = self.loader.poll()
+            if event is None:
+                break
             
-            self.activity_panel.add_activity(f"📁 Tableau chargé: {os.path.basename(filename)}")
-            self.refresh_board()
-            messagebox.showinfo("Succès", f"Tableau chargé: {os.path.basename(filename)}")
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur de chargement:\n{str(e)}")
+            kind, payload, progress = event
+            if kind == 'column':
+                self.board.add_column(payload)
+                self.create_column(payload, len(self.column_frames), self.col_width)
+                # L'ancienne dernière colonne peut désormais aller à droite
+                if len(self.column_frames) > 1 and self.column_frames[-2].btn_frame:
+                    self.column_frames[-2].update_buttons()
+                self.relayout()
+            elif kind == 'cards':
+                column, cards, tokens = payload
+                for card, card_tokens in zip(cards, tokens):
+                    self.board.add_card(card, column, card_tokens)
+                self.mark_dirty(column)
+            elif kind == 'activities':
+                self.loading = self.loading[:3] + (payload,)
+            elif kind == 'error':
+                self.abort_loading(payload)
+                return
+            else:
+                self.update_board()
+                self.finish_loading()
+                return
+        
+        self.update_board()
+        if progress is not None:
+            self.load_progress['value'] = progress * 100
+            self.load_label.configure(text=f"📁 Chargement… {int(progress * 100)} %")
+        self.load_job = self.root.after(1 if progress is not None else 20, self.poll_loader)
+    
+    def stop_loading(self):
+        filename, previous, version, activities = self.loading
+        self.loader = None
+        self.loading = None
+        self.load_progress.pack_forget()
+        self.load_label.pack_forget()
+        return filename, previous, version, activities
+    
+    def abort_loading(self, error):
+        filename, previous, version, activities = self.stop_loading()
+        self.board = previous
+        self.refresh_board()
+        messagebox.showerror("Erreur", f"Erreur de chargement:\n{str(error)}")
+    
+    def finish_loading(self):
+        filename, previous, version, activities = self.stop_loading()
+        if self.store:
+            self.store.replace_board(self.board)
+        elif self.journal:
+            self.changed()
+        else:
+            self.saved_version = version
+            self.dirty = self.version != version
+            # Tableau lu dans un autre fichier: board_path ne le contient pas encore
+            if os.path.abspath(filename) != os.path.abspath(self.board_path):
+                self.changed()
+        
+        if activities is not None:
+            self.activity_log.activities = activities
+            self.activity_panel.refresh()
+        
+        self.activity_panel.add_activity(f"📁 Tableau chargé: {os.path.basename(filename)}")
+        if self.journal:
+            self.save_board(quiet=True)
+        messagebox.showinfo("Succès", f"Tableau chargé: {os.path.basename(filename)}")
+
+def install_profiler(profiler):
+    profiler.instrument(EnhancedKanbanApp, ['refresh_board', 'create_column', 'update_board', 'apply_op',
+                                            'move_card', 'save_board', 'submit_save', 'relayout',
+                                            'apply_filter', 'poll_loader', 'open_board', 'poll_sync'],
+                        count_widgets=('refresh_board', 'create_column', 'update_board', 'open_board'))
+    profiler.instrument(DragDropCard, ['setup_ui', 'apply_card', 'bind_children_drag', 'start_drag',
+                                       'on_drag', 'end_drag', 'find_drop_position'])
+    profiler.instrument(WidgetCardRenderer, ['render', 'acquire_widget', 'release_widget'])
+    profiler.instrument(CanvasCardRenderer, ['render', 'start_drag', 'on_drag', 'end_drag'])
+    profiler.instrument(ColumnFrame, ['sync_cards'])
+    profiler.instrument(ResizableActivityPanel, ['add_activity', 'refresh', 'load_history_page'])
 
 def main():
+    parser = argparse.ArgumentParser(description="Enhanced Kanban Board")
+    parser.add_argument('--virtual', action='store_true',
+                        help="ne matérialise que les cartes visibles de chaque colonne")
+    parser.add_argument('--renderer', choices=['widgets', 'canvas'], default='widgets',
+                        help="widgets: une carte = un Frame Tk, canvas: cartes dessinées sur le canvas de la colonne")
+    parser.add_argument('--activity-capacity', type=int, default=1000,
+                        help="nombre d'entrées conservées dans le journal d'activité")
+    parser.add_argument('--autosave', type=float, metavar='SECONDES',
+                        help="sauvegarde automatique en arrière-plan après chaque série de modifications")
+    parser.add_argument('--no-journal', action='store_true',
+                        help="désactive le journal des opérations (sauvegarde complète uniquement)")
+    parser.add_argument('--compact-every', type=int, default=500, metavar='N',
+                        help="réécrit l'instantané et vide le journal toutes les N opérations")
+    parser.add_argument('--storage', choices=['json', 'sqlite'], default='json',
+                        help="sqlite: chaque opération est écrite dans une base SQLite, "
+                             "Ctrl+S exporte le tableau en JSON")
+    parser.add_argument('--db', default="enhanced_kanban.db", metavar='FICHIER',
+                        help="base SQLite utilisée avec --storage sqlite")
+    parser.add_argument('--swimlanes', action='store_true',
+                        help="regroupe les cartes de chaque colonne en couloirs par assigné")
+    parser.add_argument('--boards', metavar='DOSSIER',
+                        help="mode multi-tableaux: un tableau par fichier .json/.kbs du dossier")
+    parser.add_argument('--board-cache', type=int, default=3, metavar='N',
+                        help="nombre de tableaux gardés en mémoire (avec leurs colonnes) en mode multi-tableaux")
+    parser.add_argument('--profile', action='store_true',
+                        help="mesure les chemins critiques et affiche le panneau de performances")
+    parser.add_argument('--profile-output', metavar='FICHIER',
+                        help="exporte les mesures en JSON à la fermeture (implique --profile)")
+    parser.add_argument('--board', default="enhanced_kanban.json", metavar='FICHIER',
+                        help="instantané du tableau; l'extension .kbs utilise le format binaire compact")
+    parser.add_argument('--sync', metavar='URL',
+                        help="partage le tableau via un serveur local (python sync_server.py), "
+                             "par exemple http://127.0.0.1:8765; la copie locale va dans <board>.sync.json")
+    args = parser.parse_args()
+    if args.boards and args.storage == 'sqlite':
+        parser.error("--boards n'est pas disponible avec --storage sqlite")
+    if args.sync and (args.boards or args.storage == 'sqlite'):
+        parser.error("--sync n'est pas disponible avec --boards ni --storage sqlite")
+    if args.boards:
+        os.makedirs(args.boards, exist_ok=True)
+    
     root = tk.Tk()
-    app = EnhancedKanbanApp(root)
+    profiler = None
+    if args.profile or args.profile_output:
+        profiler = Profiler(widget_counter=lambda: count_widgets(root))
+        install_profiler(profiler)
+    
+    app = EnhancedKanbanApp(root, virtual=args.virtual, renderer=args.renderer,
+                            activity_capacity=args.activity_capacity,
+                            autosave_delay=int(args.autosave * 1000) if args.autosave else None,
+                            journal=not args.no_journal, compact_every=args.compact_every,
+                            storage=args.storage, db_path=args.db, board_path=args.board,
+                            swimlanes=args.swimlanes, boards_dir=args.boards,
+                            board_cache=max(1, args.board_cache), profiler=profiler, sync_url=args.sync)
+    if profiler:
+        profiler.instrument(app.saver, ['writer'])
     
     def on_closing():
-        if messagebox.askyesno("Quitter", "💾 Sauvegarder avant de quitter ?"):
-            app.save_board()
-        root.destroy()
+        if args.profile_output:
+            profiler.export(args.profile_output)
+        app.close_sync()
+        if app.store:
+            app.store.close()
+            root.destroy()
+        elif app.use_journal:
+            app.close_journals()
+            root.destroy()
+        elif app.unsaved() and messagebox.askyesno("Quitter", "💾 Sauvegarder avant de quitter ?"):
+            app.save_all(callback=root.destroy)
+        else:
+            root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     
     root.bind('<Control-s>', lambda e: app.save_board())
     root.bind('<Control-o>', lambda e: app.load_board())
     root.bind('<Control-n>', lambda e: app.add_card_to_backlog())
+    root.bind('<Escape>', lambda e: app.clear_selection())
     
-    root.bind('<Configure>', lambda e: app.refresh_board() if e.widget == root else None)
+    root.bind('<Configure>', lambda e: app.schedule_relayout(e) if e.widget == root else None)
     
     root.focus_force()
     root.mainloop()
@@ -0,0 +1,402 @@
+import json
+import os
+import queue
+import re
+import threading
+import uuid
+from datetime import datetime
+
+from binary_snapshot import decode_snapshot, encode_snapshot
+from board_model import BoardModel, KanbanCard, KanbanColumn
+from search_index import card_tokens
+
+BINARY_EXTENSION = ".kbs"
+
+def snapshot_board(board, activities=(), journal_seq=None):
+    columns = tuple(
+        (column.name, column.is_backlog,
+         tuple((card.title, card.description, card.assigned_to, card.color, card.id, card.rank)
+               for card in column.cards))
+        for column in board.columns
+    )
+    return columns, tuple(activities), datetime.now().isoformat(), journal_seq
+
+def snapshot_to_dict(snapshot):
+    columns, activities, saved_at, journal_seq = snapshot
+    data = {
+        'columns': [
+            {
+                'name': name,
+                'is_backlog': is_backlog,
+                'cards': [
+                    {
+                        'title': title,
+                        'description': description,
+                        'assigned_to': assigned_to,
+                        'color': color,
+                        'id': card_id,
+                        'rank': rank
+                    }
+                    for title, description, assigned_to, color, card_id, rank in cards
+                ]
+            }
+            for name, is_backlog, cards in columns
+        ],
+        'activities': list(activities),
+        'saved_at': saved_at
+    }
+    if journal_seq is not None:
+        data['journal_seq'] = journal_seq
+    return data
+
+def column_from_dict(col_data):
+    column = KanbanColumn(col_data['name'], col_data.get('is_backlog', False))
+    column.cards = [KanbanCard.from_dict(card_data) for card_data in col_data.get('cards', [])]
+    return column
+
+def board_from_dict(data):
+    board = BoardModel([column_from_dict(col_data) for col_data in data.get('columns', [])])
+    return board, data.get('activities')
+
+def is_binary_path(path):
+    return path.lower().endswith(BINARY_EXTENSION)
+
+def create_temp(path):
+    # Fichier temporaire voisin: droits du fichier remplacé, sinon 0666 filtré par le umask, appliqué
+    # par le noyau (modifier le umask changerait celui des fichiers créés au même moment par l'autre thread)
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    tmp_path = f"{os.path.abspath(path)}.{uuid.uuid4().hex[:12]}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666 if mode is None else mode)
+    if mode is not None:
+        try:
+            os.chmod(tmp_path, mode)
+        except BaseException:
+            os.close(fd)
+            os.remove(tmp_path)
+            raise
+    return fd, tmp_path
+
+def write_atomic(path, write, binary=False, newline=None):
+    fd, tmp_path = create_temp(path)
+    try:
+        with os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding='utf-8', newline=newline) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_json_atomic(path, data, indent=2):
+    write_atomic(path, lambda f: json.dump(data, f, indent=indent, ensure_ascii=False))
+
+def write_binary_atomic(path, data, compress=True):
+    payload = encode_snapshot(data, compress)
+    write_atomic(path, lambda f: f.write(payload), binary=True)
+
+def write_snapshot(path, snapshot):
+    data = snapshot_to_dict(snapshot)
+    if is_binary_path(path):
+        write_binary_atomic(path, data)
+    else:
+        write_json_atomic(path, data)
+
+def read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def read_binary(path):
+    with open(path, 'rb') as f:
+        return decode_snapshot(f.read())
+
+def read_snapshot(path):
+    return read_binary(path) if is_binary_path(path) else read_json(path)
+
+class JSONStream:
+    WHITESPACE = re.compile(r'[ \t\n\r]*')
+    
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+    
+    def progress(self):
+        return self.pos / len(self.text) if self.text else 1.0
+    
+    def peek(self):
+        self.pos = self.WHITESPACE.match(self.text, self.pos).end()
+        return self.text[self.pos:self.pos + 1]
+    
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"'{char}' attendu à la position {self.pos}")
+        self.pos += 1
+    
+    def value(self):
+        self.peek()
+        value, self.pos = self.decoder.raw_decode(self.text, self.pos)
+        return value
+    
+    def keys(self):
+        # Le code appelant doit consommer la valeur de chaque clé avant de passer à la suivante
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect('}')
+            return
+    
+    def elements(self):
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect(']')
+            return
+
+def stream_board(path, batch_size=500):
+    if is_binary_path(path):
+        yield from stream_binary_board(path, batch_size)
+        return
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = JSONStream(f.read())
+    
+    for key in stream.keys():
+        if key == 'columns':
+            for _ in stream.elements():
+                yield from stream_column(stream, batch_size)
+        elif key == 'activities':
+            yield 'activities', stream.value(), stream.progress()
+        else:
+            stream.value()
+
+def stream_column(stream, batch_size):
+    name, is_backlog, column, batch = None, False, None, []
+    for key in stream.keys():
+        if key == 'name':
+            name = stream.value()
+        elif key == 'is_backlog':
+            is_backlog = stream.value()
+        elif key == 'cards':
+            if column is None and name is not None:
+                column = KanbanColumn(name, is_backlog)
+                yield 'column', column, stream.progress()
+            for _ in stream.elements():
+                batch.append(KanbanCard.from_dict(stream.value()))
+                if len(batch) >= batch_size and column is not None:
+                    yield 'cards', (column, batch), stream.progress()
+                    batch = []
+        else:
+            stream.value()
+    
+    if column is None:
+        if name is None:
+            raise ValueError("colonne sans nom")
+        column = KanbanColumn(name, is_backlog)
+        yield 'column', column, stream.progress()
+    if batch:
+        yield 'cards', (column, batch), stream.progress()
+
+def stream_binary_board(path, batch_size=500):
+    data = read_binary(path)
+    total = max(1, sum(len(col_data['cards']) for col_data in data['columns']))
+    done = 0
+    for col_data in data['columns']:
+        column = KanbanColumn(col_data['name'], col_data['is_backlog'])
+        yield 'column', column, done / total
+        cards = col_data['cards']
+        for start in range(0, len(cards), batch_size):
+            batch = [KanbanCard.from_dict(card_data) for card_data in cards[start:start + batch_size]]
+            done += len(batch)
+            yield 'cards', (column, batch), done / total
+    if 'activities' in data:
+        yield 'activities', data['activities'], 1.0
+
+class BackgroundLoader:
+    def __init__(self, path, batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self.events = queue.Queue()
+        self.worker = threading.Thread(target=self.run, name="kanban-load", daemon=True)
+        self.worker.start()
+    
+    def run(self):
+        try:
+            for kind, payload, progress in stream_board(self.path, self.batch_size):
+                if kind == 'cards':
+                    # Jetons de recherche calculés ici plutôt que sur le thread Tk
+                    column, cards = payload
+                    payload = (column, cards, [card_tokens(card) for card in cards])
+                self.events.put((kind, payload, progress))
+        except Exception as e:
+            self.events.put(('error', e, 1.0))
+        else:
+            self.events.put(('done', None, 1.0))
+    
+    def poll(self):
+        try:
+            return self.events.get_nowait()
+        except queue.Empty:
+            return None
+
+class BoardJournal:
+    def __init__(self, snapshot_path, journal_path=None, compact_every=500):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or os.path.splitext(snapshot_path)[0] + ".journal"
+        self.compact_every = compact_every
+        self.seq = 0
+        self.pending = 0
+        self.file = None
+        self.end = 0
+    
+    def read_ops(self):
+        # end: octet suivant la dernière ligne complète et lisible
+        self.end = 0
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                if line.strip():
+                    try:
+                        op = json.loads(line)
+                    except ValueError:
+                        return
+                    self.end += len(line)
+                    yield op
+                else:
+                    self.end += len(line)
+    
+    def load(self):
+        data = read_snapshot(self.snapshot_path) if os.path.exists(self.snapshot_path) else None
+        if data is None:
+            board, activities = BoardModel.default(), None
+        else:
+            board, activities = board_from_dict(data)
+        
+        snapshot_seq = data.get('journal_seq', 0) if data else 0
+        self.seq = snapshot_seq
+        self.pending = 0
+        for op in self.read_ops():
+            if op['seq'] <= snapshot_seq:
+                continue
+            board.apply(op)
+            self.seq = op['seq']
+            self.pending += 1
+        
+        # Ligne coupée par un arrêt brutal: retirée avant tout ajout, sinon l'opération suivante
+        # s'y collerait et serait illisible au prochain démarrage
+        if os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > self.end:
+            self.close()
+            os.truncate(self.journal_path, self.end)
+        return board, activities
+    
+    def open(self):
+        if self.file is None:
+            self.file = open(self.journal_path, 'a', encoding='utf-8')
+        return self.file
+    
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+    
+    def record(self, op):
+        self.seq += 1
+        op = dict(op, seq=self.seq)
+        f = self.open()
+        f.write(json.dumps(op, ensure_ascii=False) + "\n")
+        f.flush()
+        self.pending += 1
+        return op
+    
+    def should_compact(self):
+        return self.pending >= self.compact_every
+    
+    def truncate_through(self, seq):
+        self.close()
+        tail = [op for op in self.read_ops() if op['seq'] > seq]
+        fd, tmp_path = create_temp(self.journal_path)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for op in tail:
+                f.write(json.dumps(op, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+        self.pending = len(tail)
+
+class BackgroundSaver:
+    def __init__(self, writer=None):
+        self.writer = writer or write_snapshot
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.worker = None
+        self.results = queue.Queue()
+    
+    def submit(self, path, snapshot, version, callback=None):
+        callbacks = [callback] if callback else []
+        with self.lock:
+            # Un seul instantané en attente par fichier: le plus récent remplace les précédents
+            previous = self.pending.pop(path, None)
+            if previous is not None:
+                callbacks = previous[2] + callbacks
+            self.pending[path] = (snapshot, version, callbacks)
+            if self.worker is None:
+                self.worker = threading.Thread(target=self.run, name="kanban-save", daemon=True)
+                self.worker.start()
+    
+    def busy(self):
+        with self.lock:
+            return self.worker is not None
+    
+    def run(self):
+        while True:
+            with self.lock:
+                if not self.pending:
+                    self.worker = None
+                    return
+                path = next(iter(self.pending))
+                snapshot, version, callbacks = self.pending.pop(path)
+            
+            try:
+                self.writer(path, snapshot)
+                error = None
+            except Exception as e:
+                error = e
+            self.results.put((path, version, error, callbacks))
+    
+    def poll(self):
+        results = []
+        while True:
+            try:
+                results.append(self.results.get_nowait())
+            except queue.Empty:
+                return results
+    
+    def join(self, timeout=None):
+        worker = self.worker
+        if worker is not None:
+            worker.join(timeout)
+    
+    def wait(self, timeout=None):
+        self.join(timeout)
+        return self.poll()
@@ -0,0 +1,122 @@
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+SMALLEST_INTEGER = "A" + DIGITS[0] * 26
+
+# Une clé = partie entière (préfixe de longueur + chiffres) + fraction facultative.
+# L'ordre lexicographique des chaînes est l'ordre des cartes: insérer entre deux cartes
+# ne touche que la clé de la carte déplacée, et ajouter en fin de colonne reste court.
+
+def integer_length(head):
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    if "A" <= head <= "Z":
+        return ord("Z") - ord(head) + 2
+    raise ValueError(f"clé de rang invalide: {head!r}")
+
+def split_key(key):
+    if key == SMALLEST_INTEGER:
+        raise ValueError(f"clé de rang invalide: {key!r}")
+    length = integer_length(key[0])
+    if len(key) < length or key[length:].endswith(DIGITS[0]):
+        raise ValueError(f"clé de rang invalide: {key!r}")
+    return key[:length], key[length:]
+
+def midpoint(a, b):
+    # Fraction strictement entre a et b (b=None: entre a et 1), sans zéro final
+    if b is not None:
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else DIGITS[0]) == b[n]:
+            n += 1
+        if n:
+            return b[:n] + midpoint(a[n:], b[n:])
+    
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else len(DIGITS)
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    if b is not None and len(b) > 1:
+        return b[0]
+    return DIGITS[digit_a] + midpoint(a[1:], None)
+
+def increment_integer(integer):
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        value = DIGITS.index(digits[i]) + 1
+        if value < len(DIGITS):
+            digits[i] = DIGITS[value]
+            return head + "".join(digits)
+        digits[i] = DIGITS[0]
+    
+    if head == "Z":
+        return "a" + DIGITS[0]
+    if head == "z":
+        return None
+    head = chr(ord(head) + 1)
+    if head > "a":
+        digits.append(DIGITS[0])
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+def decrement_integer(integer):
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        value = DIGITS.index(digits[i]) - 1
+        if value >= 0:
+            digits[i] = DIGITS[value]
+            return head + "".join(digits)
+        digits[i] = DIGITS[-1]
+    
+    if head == "a":
+        return "Z" + DIGITS[-1]
+    if head == "A":
+        return None
+    head = chr(ord(head) - 1)
+    if head < "Z":
+        digits.append(DIGITS[-1])
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+def key_between(a, b):
+    if a is not None and b is not None and a >= b:
+        raise ValueError(f"clés de rang non ordonnées: {a!r} >= {b!r}")
+    
+    if a is None:
+        if b is None:
+            return "a" + DIGITS[0]
+        integer_b, fraction_b = split_key(b)
+        if integer_b == SMALLEST_INTEGER:
+            return integer_b + midpoint("", fraction_b)
+        if integer_b < b:
+            return integer_b
+        key = decrement_integer(integer_b)
+        if key is None:
+            raise ValueError("plus de clé de rang disponible en tête")
+        return key
+    
+    integer_a, fraction_a = split_key(a)
+    if b is None:
+        key = increment_integer(integer_a)
+        return integer_a + midpoint(fraction_a, None) if key is None else key
+    
+    integer_b, fraction_b = split_key(b)
+    if integer_a == integer_b:
+        return integer_a + midpoint(fraction_a, fraction_b)
+    key = increment_integer(integer_a)
+    if key is not None and key < b:
+        return key
+    return integer_a + midpoint(fraction_a, None)
+
+def keys_between(a, b, count):
+    if count <= 0:
+        return []
+    if b is None:
+        keys = []
+        for _ in range(count):
+            a = key_between(a, None)
+            keys.append(a)
+        return keys
+    # Bissection récursive: les clés restent en O(log count) caractères
+    middle = count // 2
+    key = key_between(a, b)
+    return keys_between(a, key, middle) + [key] + keys_between(key, b, count - middle - 1)
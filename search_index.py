@@ -0,0 +1,103 @@
+import re
+import unicodedata
+from bisect import bisect_left
+
+WORD = re.compile(r"\w+")
+COMBINING = re.compile("[\u0300-\u036f]")
+
+def normalize(text):
+    if text.isascii():
+        return text.lower()
+    # "Révision" et "revision" doivent donner le même jeton
+    return COMBINING.sub("", unicodedata.normalize('NFKD', text.casefold()))
+
+def tokenize(text):
+    return WORD.findall(normalize(text))
+
+def card_tokens(card):
+    return frozenset(tokenize(f"{card.title} {card.description} {card.assigned_to}"))
+
+class SearchIndex:
+    # Pas de jetons gardés par carte: ils sont recalculés depuis ses champs avant modification
+    def __init__(self, cards=()):
+        self.postings = {}
+        self.tokens = []
+        self.fresh = set()
+        postings = self.postings
+        for card in cards:
+            for token in card_tokens(card):
+                ids = postings.get(token)
+                if ids is None:
+                    ids = postings[token] = set()
+                ids.add(card.id)
+        self.tokens = sorted(postings)
+    
+    def post(self, token, card_id):
+        # Les nouveaux jetons attendent la prochaine recherche pour être triés: un chargement
+        # de 100k cartes ne paie pas une insertion triée par jeton
+        ids = self.postings.get(token)
+        if ids is None:
+            ids = self.postings[token] = set()
+            self.fresh.add(token)
+        ids.add(card_id)
+    
+    def unpost(self, token, card_id):
+        ids = self.postings.get(token)
+        if ids is None:
+            return
+        ids.discard(card_id)
+        if not ids:
+            del self.postings[token]
+            if token in self.fresh:
+                self.fresh.discard(token)
+            else:
+                del self.tokens[bisect_left(self.tokens, token)]
+    
+    def add(self, card, tokens=None):
+        for token in card_tokens(card) if tokens is None else tokens:
+            self.post(token, card.id)
+    
+    def remove(self, card):
+        for token in card_tokens(card):
+            self.unpost(token, card.id)
+    
+    def update(self, card, old_tokens):
+        tokens = card_tokens(card)
+        for token in old_tokens - tokens:
+            self.unpost(token, card.id)
+        for token in tokens - old_tokens:
+            self.post(token, card.id)
+    
+    def merge_fresh(self):
+        if self.fresh:
+            # Deux séquences triées: le tri fusionne en temps linéaire
+            self.tokens.extend(sorted(self.fresh))
+            self.tokens.sort()
+            self.fresh = set()
+    
+    def prefix_matches(self, prefix):
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\U0010ffff", start)
+        if end - start == 1:
+            return self.postings[self.tokens[start]]
+        
+        ids = set()
+        for token in self.tokens[start:end]:
+            ids.update(self.postings[token])
+        return ids
+    
+    def search(self, query):
+        terms = tokenize(query)
+        if not terms:
+            return None
+        
+        self.merge_fresh()
+        # On commence par le terme le plus long, généralement le plus sélectif
+        terms.sort(key=len, reverse=True)
+        result = None
+        for term in terms:
+            ids = self.prefix_matches(term)
+            result = set(ids) if result is None else result & ids
+            if not result:
+                return set()
+        return result
@@ -0,0 +1,173 @@
+import sqlite3
+import time
+
+from board_model import BoardModel, KanbanCard, KanbanColumn
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS columns (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    is_backlog INTEGER NOT NULL DEFAULT 0,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_columns_position ON columns(position);
+
+CREATE TABLE IF NOT EXISTS cards (
+    id TEXT PRIMARY KEY,
+    column_id INTEGER NOT NULL REFERENCES columns(id),
+    position INTEGER NOT NULL DEFAULT 0,
+    rank TEXT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    assigned_to TEXT NOT NULL DEFAULT '',
+    color TEXT NOT NULL DEFAULT '#ffffff'
+);
+CREATE INDEX IF NOT EXISTS idx_cards_assigned_to ON cards(assigned_to);
+
+CREATE TABLE IF NOT EXISTS activities (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_activities_ts ON activities(ts);
+"""
+
+# L'ordre des cartes est porté par la clé de rang; position ne sert plus qu'à lire les anciennes bases
+RANK_INDEX = "CREATE INDEX IF NOT EXISTS idx_cards_column_rank ON cards(column_id, rank)"
+
+def card_rank(board, card_id):
+    # Dans un lot, la carte peut déjà avoir été supprimée par une opération suivante
+    entry = board.find(card_id)
+    return entry[1].rank if entry else None
+
+class SQLiteActivityHistory:
+    def __init__(self, store):
+        self.store = store
+    
+    def append(self, message, timestamp=None):
+        record = {'ts': time.time() if timestamp is None else timestamp, 'message': message}
+        with self.store.connection:
+            self.store.connection.execute("INSERT INTO activities (ts, message) VALUES (?, ?)",
+                                          (record['ts'], message))
+        return record
+    
+    def read_page(self, cursor=None, limit=200):
+        if cursor is None:
+            rows = self.store.connection.execute(
+                "SELECT id, ts, message FROM activities ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        else:
+            rows = self.store.connection.execute(
+                "SELECT id, ts, message FROM activities WHERE id < ? ORDER BY id DESC LIMIT ?",
+                (cursor, limit)).fetchall()
+        records = [{'ts': ts, 'message': message} for _, ts, message in rows]
+        next_cursor = rows[-1][0] if len(rows) == limit else None
+        return records, next_cursor
+    
+    def close(self):
+        pass
+
+class SQLiteBoardStore:
+    def __init__(self, path="enhanced_kanban.db"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.migrate()
+        self.column_ids = {}
+    
+    def migrate(self):
+        names = [row[1] for row in self.connection.execute("PRAGMA table_info(cards)")]
+        with self.connection:
+            if 'rank' not in names:
+                self.connection.execute("ALTER TABLE cards ADD COLUMN rank TEXT")
+            self.connection.execute(RANK_INDEX)
+    
+    def close(self):
+        self.connection.close()
+    
+    def activity_history(self):
+        return SQLiteActivityHistory(self)
+    
+    def is_empty(self):
+        return self.connection.execute("SELECT COUNT(*) FROM columns").fetchone()[0] == 0
+    
+    def load(self):
+        columns = []
+        by_id = {}
+        self.column_ids = {}
+        for column_id, name, is_backlog in self.connection.execute(
+                "SELECT id, name, is_backlog FROM columns ORDER BY position"):
+            column = KanbanColumn(name, bool(is_backlog))
+            columns.append(column)
+            by_id[column_id] = column
+            self.column_ids[column] = column_id
+        
+        unranked = False
+        for card_id, column_id, title, description, assigned_to, color, rank in self.connection.execute(
+                "SELECT id, column_id, title, description, assigned_to, color, rank FROM cards "
+                "ORDER BY column_id, rank IS NULL, rank, position"):
+            by_id[column_id].cards.append(KanbanCard(title, description, assigned_to, color, card_id, rank))
+            unranked = unranked or rank is None
+        
+        board = BoardModel(columns)
+        if unranked:
+            # Base d'avant les rangs: les clés attribuées au chargement sont écrites une fois pour toutes
+            with self.connection:
+                self.connection.executemany("UPDATE cards SET rank = ? WHERE id = ?",
+                                            ((card.rank, card.id) for column in columns for card in column.cards))
+        return board
+    
+    def replace_board(self, board):
+        self.column_ids = {}
+        with self.connection:
+            self.connection.execute("DELETE FROM cards")
+            self.connection.execute("DELETE FROM columns")
+            for position, column in enumerate(board.columns):
+                cursor = self.connection.execute(
+                    "INSERT INTO columns (name, is_backlog, position) VALUES (?, ?, ?)",
+                    (column.name, int(column.is_backlog), position))
+                column_id = cursor.lastrowid
+                self.column_ids[column] = column_id
+                self.connection.executemany(
+                    "INSERT INTO cards (id, column_id, position, rank, title, description, assigned_to, color) "
+                    "VALUES (?, ?, 0, ?, ?, ?, ?, ?)",
+                    ((card.id, column_id, card.rank, card.title, card.description,
+                      card.assigned_to, card.color)
+                     for card in column.cards))
+    
+    def record(self, op, board):
+        with self.connection:
+            self.write_op(op, board)
+    
+    def write_op(self, op, board):
+        kind = op['op']
+        if kind == 'add_card':
+            column_id = self.column_ids[board.columns[op['column']]]
+            card = op['card']
+            self.connection.execute(
+                "INSERT INTO cards (id, column_id, position, rank, title, description, assigned_to, color) "
+                "VALUES (?, ?, 0, ?, ?, ?, ?, ?)",
+                (card['id'], column_id, card_rank(board, card['id']), card['title'],
+                 card.get('description', ''), card.get('assigned_to', ''), card.get('color', '#ffffff')))
+        elif kind == 'update_card':
+            fields = op['fields']
+            assignments = ", ".join(f"{name} = ?" for name in fields)
+            self.connection.execute(f"UPDATE cards SET {assignments} WHERE id = ?",
+                                    (*fields.values(), op['id']))
+        elif kind == 'delete_card':
+            self.connection.execute("DELETE FROM cards WHERE id = ?", (op['id'],))
+        elif kind == 'move_card':
+            # Une seule ligne réécrite: la clé de rang de la carte déplacée
+            column_id = self.column_ids[board.columns[op['to']]]
+            self.connection.execute("UPDATE cards SET column_id = ?, rank = ? WHERE id = ?",
+                                    (column_id, card_rank(board, op['id']), op['id']))
+        elif kind == 'move_column':
+            for position in (op['from'], op['to']):
+                self.connection.execute("UPDATE columns SET position = ? WHERE id = ?",
+                                        (position, self.column_ids[board.columns[position]]))
+        elif kind == 'batch':
+            for sub_op in op['ops']:
+                self.write_op(sub_op, board)
+        else:
+            raise ValueError(f"opération inconnue: {kind}")
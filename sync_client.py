@@ -0,0 +1,193 @@
+import json
+import queue
+import threading
+import urllib.error
+import urllib.request
+import uuid
+from collections import deque
+
+from persistence import board_from_dict
+
+OP_ERRORS = (KeyError, IndexError, ValueError, TypeError, AttributeError)
+
+class SyncClient:
+    WAIT = 25.0
+    RETRY = 2.0
+    
+    def __init__(self, url, client_id=None):
+        self.url = url.rstrip('/')
+        self.client_id = client_id or uuid.uuid4().hex
+        self.epoch = None
+        self.version = 0
+        self.seq = 0
+        self.outgoing = queue.Queue()
+        self.events = queue.Queue()
+        self.lock = threading.Lock()
+        self.resetting = threading.Event()
+        self.stopped = threading.Event()
+        self.sender = None
+    
+    def request(self, method, path, body=None, timeout=10.0):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8') if body is not None else None
+        request = urllib.request.Request(self.url + path, data=data, method=method,
+                                         headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as e:
+            # Les refus du serveur portent leur message en JSON
+            if e.code in (400, 409):
+                return json.load(e)
+            raise
+    
+    def fetch_board(self):
+        data = self.request('GET', '/board')
+        with self.lock:
+            self.epoch = data['epoch']
+            self.version = data['version']
+        return data
+    
+    def start(self):
+        threading.Thread(target=self.receive, daemon=True).start()
+        self.sender = threading.Thread(target=self.send_loop, daemon=True)
+        self.sender.start()
+    
+    def close(self, timeout=2.0):
+        # Les opérations déjà en file partent avant l'arrêt, dans la limite du délai
+        self.outgoing.put(None)
+        if self.sender is not None:
+            self.sender.join(timeout)
+        self.stopped.set()
+    
+    def send(self, op):
+        self.seq += 1
+        self.outgoing.put((self.seq, op))
+        return self.seq
+    
+    def request_reset(self):
+        # Thread à part: le receveur peut être bloqué dans une attente longue côté serveur
+        if not self.resetting.is_set():
+            self.resetting.set()
+            threading.Thread(target=self.reset, daemon=True).start()
+    
+    def reset(self):
+        while not self.stopped.is_set():
+            try:
+                data = self.fetch_board()
+            except (OSError, ValueError, KeyError) as e:
+                self.events.put(('error', str(e)))
+                self.stopped.wait(self.RETRY)
+                continue
+            self.events.put(('reset', data))
+            break
+        self.resetting.clear()
+    
+    def poll(self):
+        try:
+            return self.events.get_nowait()
+        except queue.Empty:
+            return None
+    
+    def send_loop(self):
+        while True:
+            item = self.outgoing.get()
+            if item is None:
+                return
+            
+            seq, op = item
+            try:
+                result = self.request('POST', '/ops', {'client': self.client_id, 'seq': seq, 'op': op})
+            except (OSError, ValueError) as e:
+                # Perdue ou non: on ne peut pas le savoir, le tableau sera rechargé
+                result = {'error': str(e)}
+            if 'error' in result:
+                self.events.put(('rejected', (seq, result['error'])))
+    
+    def receive(self):
+        failing = False
+        while not self.stopped.is_set():
+            if self.resetting.is_set():
+                self.stopped.wait(0.1)
+                continue
+            
+            with self.lock:
+                epoch, since = self.epoch, self.version
+            try:
+                data = self.request('GET', f"/ops?since={since}&wait={self.WAIT}", timeout=self.WAIT + 10)
+                if data.get('reset') or data['epoch'] != epoch:
+                    # Serveur redémarré ou client trop en retard pour le journal du serveur
+                    self.request_reset()
+                elif data['ops']:
+                    with self.lock:
+                        if self.epoch == epoch:
+                            self.version = max(self.version, data['ops'][-1]['version'])
+                    self.events.put(('ops', (epoch, data['ops'])))
+            except (OSError, ValueError, KeyError) as e:
+                if not failing:
+                    self.events.put(('error', str(e)))
+                failing = True
+                self.stopped.wait(self.RETRY)
+                continue
+            
+            if failing:
+                self.events.put(('connected', None))
+                failing = False
+
+class SyncSession:
+    # Réconciliation côté client: opérations locales en route, versions reçues, divergences
+    def __init__(self, client):
+        self.client = client
+        self.pending = deque()
+        self.epoch = None
+        self.version = 0
+        self.conflict = False
+    
+    def send(self, op):
+        self.pending.append((self.client.send(op), op))
+    
+    def accept(self, epoch, entries):
+        remote = []
+        for entry in entries:
+            if epoch != self.epoch or entry['version'] <= self.version:
+                continue
+            
+            self.version = entry['version']
+            if entry['client'] == self.client.client_id:
+                # Déjà appliquée localement à l'envoi
+                while self.pending and self.pending[0][0] <= entry['seq']:
+                    self.pending.popleft()
+                if entry['partial']:
+                    self.conflict = True
+                continue
+            
+            if self.pending:
+                # Le serveur a placé cette opération avant une des nôtres, déjà appliquée ici
+                self.conflict = True
+            remote.append(entry['op'])
+        return remote
+    
+    def rejected(self, seq):
+        self.pending = deque(item for item in self.pending if item[0] != seq)
+        self.conflict = True
+    
+    def adopt(self, data):
+        self.epoch = data['epoch']
+        self.version = data['version']
+        last_seq = data['clients'].get(self.client.client_id, 0)
+        while self.pending and self.pending[0][0] <= last_seq:
+            self.pending.popleft()
+        
+        board, _ = board_from_dict(data['board'])
+        # Les opérations locales que le serveur n'a pas encore reçues sont rejouées sur son instantané
+        for seq, op in self.pending:
+            try:
+                board.apply(op)
+            except OP_ERRORS:
+                self.conflict = True
+        return board
+    
+    def resolve(self):
+        # État local divergent (ordre différent de celui du serveur, refus): on repart de son instantané
+        if self.conflict and not self.pending:
+            self.conflict = False
+            self.client.request_reset()
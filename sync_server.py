@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import threading
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+
+from board_model import BoardModel
+from persistence import board_from_dict, read_snapshot, snapshot_board, snapshot_to_dict, write_snapshot
+
+MAX_WAIT = 30.0
+
+def apply_checked(board, op):
+    # Renvoie l'opération effectivement appliquée: dans un lot, les sous-opérations devenues
+    # impossibles (carte supprimée entre-temps...) sont écartées au lieu d'annuler tout le lot
+    if op.get('op') == 'batch':
+        applied = [applied for applied in (apply_checked(board, sub_op) for sub_op in op.get('ops', []))
+                   if applied is not None]
+        return {'op': 'batch', 'ops': applied} if applied else None
+    try:
+        board.apply(op)
+    except (KeyError, IndexError, ValueError, TypeError, AttributeError):
+        return None
+    return op
+
+class SyncState:
+    def __init__(self, board, capacity=10000):
+        self.board = board
+        self.epoch = uuid.uuid4().hex
+        self.version = 0
+        self.log = deque(maxlen=capacity)
+        self.last_seq = {}
+        self.condition = threading.Condition()
+    
+    def snapshot(self):
+        with self.condition:
+            snapshot = snapshot_board(self.board)
+            version, clients = self.version, dict(self.last_seq)
+        return {'epoch': self.epoch, 'version': version, 'clients': clients,
+                'board': snapshot_to_dict(snapshot)}
+    
+    def submit(self, client, seq, op):
+        with self.condition:
+            applied = apply_checked(self.board, op)
+            if applied is None:
+                return None
+            
+            self.version += 1
+            self.last_seq[client] = seq
+            entry = {'version': self.version, 'client': client, 'seq': seq, 'op': applied,
+                     'partial': applied != op}
+            self.log.append(entry)
+            self.condition.notify_all()
+            return entry
+    
+    def ops_since(self, since, wait):
+        with self.condition:
+            if since == self.version:
+                self.condition.wait_for(lambda: self.version != since, wait)
+            
+            # Version inconnue ou trop ancienne pour le journal conservé: le client repart d'un instantané
+            oldest = self.version - len(self.log)
+            if since > self.version or since < oldest:
+                return {'epoch': self.epoch, 'version': self.version, 'reset': True}
+            return {'epoch': self.epoch, 'version': self.version,
+                    'ops': list(islice(self.log, since - oldest, None))}
+
+class SyncHandler(BaseHTTPRequestHandler):
+    server_version = "KanbanSync/1.0"
+    
+    def do_GET(self):
+        url = urlsplit(self.path)
+        state = self.server.state
+        if url.path == '/board':
+            self.reply(200, state.snapshot())
+        elif url.path == '/ops':
+            query = parse_qs(url.query)
+            try:
+                since = int(query['since'][0])
+                wait = min(max(float(query.get('wait', ['0'])[0]), 0.0), MAX_WAIT)
+            except (KeyError, ValueError):
+                self.reply(400, {'error': "paramètres since/wait invalides"})
+                return
+            self.reply(200, state.ops_since(since, wait))
+        elif url.path == '/health':
+            self.reply(200, {'status': 'ok', 'epoch': state.epoch, 'version': state.version})
+        else:
+            self.reply(404, {'error': f"introuvable: {url.path}"})
+    
+    def do_POST(self):
+        if urlsplit(self.path).path != '/ops':
+            self.reply(404, {'error': f"introuvable: {self.path}"})
+            return
+        
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            client, seq, op = str(body['client']), int(body['seq']), body['op']
+            if not isinstance(op, dict) or not isinstance(op.get('op'), str):
+                raise ValueError(op)
+        except (ValueError, KeyError, TypeError):
+            self.reply(400, {'error': "opération malformée"})
+            return
+        
+        entry = self.server.state.submit(client, seq, op)
+        if entry is None:
+            self.reply(409, {'error': "opération refusée: le tableau a changé entre-temps",
+                             'version': self.server.state.version})
+        else:
+            self.reply(200, {'version': entry['version'], 'partial': entry['partial']})
+    
+    def reply(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+class SyncServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def __init__(self, address, state, verbose=False):
+        super().__init__(address, SyncHandler)
+        self.state = state
+        self.verbose = verbose
+    
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+def save_state(state, path):
+    with state.condition:
+        snapshot = snapshot_board(state.board)
+    write_snapshot(path, snapshot)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur de synchronisation local: diffuse les opérations "
+                                                 "du tableau entre les clients, avec numéros de version")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--board', metavar='FICHIER',
+                        help="instantané chargé au démarrage et réécrit à l'arrêt (.json ou .kbs)")
+    parser.add_argument('--save-every', type=float, default=30.0, metavar='SECONDES',
+                        help="réécrit l'instantané périodiquement (0: seulement à l'arrêt)")
+    parser.add_argument('--log-capacity', type=int, default=10000, metavar='N',
+                        help="opérations gardées pour les clients en retard; au-delà ils rechargent le tableau")
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+    
+    if args.board and os.path.exists(args.board):
+        board, _ = board_from_dict(read_snapshot(args.board))
+    else:
+        board = BoardModel.default()
+    state = SyncState(board, args.log_capacity)
+    server = SyncServer((args.host, args.port), state, args.verbose)
+    
+    stopped = threading.Event()
+    if args.board and args.save_every > 0:
+        def autosave():
+            saved = state.version
+            while not stopped.wait(args.save_every):
+                if state.version != saved:
+                    saved = state.version
+                    save_state(state, args.board)
+        threading.Thread(target=autosave, daemon=True).start()
+    
+    print(f"Synchronisation sur {server.url} (Ctrl+C pour arrêter)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stopped.set()
+        server.server_close()
+        if args.board:
+            save_state(state, args.board)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from activity_history import ActivityHistory
+
+class ActivityHistoryTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.history = ActivityHistory(os.path.join(directory.name, "activity.log"), max_bytes=2000, backups=20)
+        self.addCleanup(self.history.close)
+    
+    def read_all(self, limit, between_pages=None):
+        messages = []
+        records, cursor = self.history.read_page(None, limit)
+        messages.extend(record['message'] for record in records)
+        while cursor is not None:
+            if between_pages:
+                between_pages()
+            records, cursor = self.history.read_page(cursor, limit)
+            messages.extend(record['message'] for record in records)
+        return messages
+    
+    def test_pages_are_newest_first_across_rotations(self):
+        for i in range(300):
+            self.history.append(f"Activité {i}", i)
+        self.assertGreater(self.history.rotations, 3)
+        
+        expected = [f"Activité {i}" for i in range(299, -1, -1)]
+        for limit in (1, 7, 50, 1000):
+            with self.subTest(limit=limit):
+                self.assertEqual(self.read_all(limit), expected)
+    
+    def test_appends_between_pages_are_not_repeated(self):
+        for i in range(300):
+            self.history.append(f"Activité {i}", i)
+        rotations = self.history.rotations
+        counter = iter(range(10 ** 6))
+        
+        def append_more():
+            for _ in range(10):
+                self.history.append(f"Nouvelle {next(counter)}")
+        
+        messages = self.read_all(25, append_more)
+        # Les rotations pendant la lecture décalent les fichiers sans faire perdre ni répéter de ligne
+        self.assertGreater(self.history.rotations, rotations)
+        self.assertEqual(messages, [f"Activité {i}" for i in range(299, -1, -1)])
+    
+    def test_oldest_backups_are_dropped(self):
+        history = ActivityHistory(self.history.path + ".court", max_bytes=500, backups=2)
+        self.addCleanup(history.close)
+        for i in range(200):
+            history.append(f"Activité {i}", i)
+        messages = []
+        records, cursor = history.read_page(None, 1000)
+        messages.extend(record['message'] for record in records)
+        self.assertIsNone(cursor)
+        self.assertEqual(messages, [f"Activité {i}" for i in range(199, 199 - len(messages), -1)])
+        self.assertLess(len(messages), 200)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from binary_snapshot import decode_snapshot, encode_snapshot
+from board_model import BoardModel, KanbanCard
+from persistence import board_from_dict, read_snapshot, snapshot_board, snapshot_to_dict, write_snapshot
+
+def sample(activities=("[12:00:00] Carte créée", "[12:00:01] Déplacée ➜ 📝")):
+    board = BoardModel.default()
+    texts = ["Révision", "日本語のタイトル", "emoji 😀🚀", "seul \ud83d demi", "", "multi\nligne\r\nfin"]
+    for i, text in enumerate(texts):
+        board.add_card(KanbanCard(text or "vide", text, "Zoë" if i % 2 else "", "#ffcccb"), board.columns[i % 3])
+    return board, list(activities)
+
+class BinarySnapshotTest(unittest.TestCase):
+    def round_trip(self, data, compress):
+        return decode_snapshot(encode_snapshot(data, compress))
+    
+    def test_round_trip_compressed_and_uncompressed(self):
+        board, activities = sample()
+        data = snapshot_to_dict(snapshot_board(board, activities, journal_seq=7))
+        for compress in (True, False):
+            with self.subTest(compress=compress):
+                self.assertEqual(self.round_trip(data, compress), data)
+    
+    def test_unicode_and_surrogates_survive(self):
+        board, _ = sample()
+        data = snapshot_to_dict(snapshot_board(board))
+        decoded, _ = board_from_dict(self.round_trip(data, True))
+        for card_id in board.index:
+            original, copy = board.get_card(card_id), decoded.get_card(card_id)
+            self.assertEqual((copy.title, copy.description, copy.assigned_to, copy.color, copy.rank),
+                             (original.title, original.description, original.assigned_to, original.color,
+                              original.rank))
+    
+    def test_empty_and_missing_activities(self):
+        board, _ = sample(activities=())
+        data = snapshot_to_dict(snapshot_board(board))
+        self.assertEqual(self.round_trip(data, True)['activities'], [])
+        
+        del data['activities']
+        self.assertNotIn('activities', self.round_trip(data, False))
+    
+    def test_board_without_ranks(self):
+        data = {'columns': [{'name': "Backlog", 'is_backlog': True,
+                             'cards': [{'title': "Ancienne", 'id': "a1"}]}]}
+        decoded = self.round_trip(data, False)
+        self.assertIsNone(decoded['columns'][0]['cards'][0]['rank'])
+    
+    def test_file_round_trip(self):
+        board, activities = sample()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "board.kbs")
+            write_snapshot(path, snapshot_board(board, activities))
+            data = read_snapshot(path)
+        self.assertEqual(data['activities'], activities)
+        self.assertEqual(sum(len(column['cards']) for column in data['columns']), len(board))
+    
+    def test_bad_magic(self):
+        payload = encode_snapshot(snapshot_to_dict(snapshot_board(sample()[0])))
+        with self.assertRaises(ValueError):
+            decode_snapshot(b"JSON" + payload[4:])
+    
+    def test_truncated_payloads(self):
+        data = snapshot_to_dict(snapshot_board(sample()[0]))
+        for compress in (True, False):
+            payload = encode_snapshot(data, compress)
+            for size in (0, 3, 5, 6, len(payload) // 2, len(payload) - 1):
+                with self.subTest(compress=compress, size=size):
+                    with self.assertRaises(ValueError):
+                        decode_snapshot(payload[:size])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board_model import KanbanCard
+from persistence import BoardJournal
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "board.json")
+    
+    def record_card(self, journal, board, title):
+        op = {'op': 'add_card', 'column': 0, 'card': KanbanCard(title).to_dict()}
+        board.apply(op)
+        journal.record(op)
+    
+    def titles(self, board):
+        return [card.title for card in board.columns[0].cards]
+    
+    def test_torn_tail_is_cut_before_new_ops(self):
+        journal = BoardJournal(self.path)
+        board, _ = journal.load()
+        self.record_card(journal, board, "Un")
+        self.record_card(journal, board, "Deux")
+        journal.close()
+        with open(journal.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"op": "add_card", "column": 0, "ca')
+        
+        journal = BoardJournal(self.path)
+        board, _ = journal.load()
+        self.assertEqual(self.titles(board), ["Un", "Deux"])
+        self.record_card(journal, board, "Trois")
+        journal.close()
+        
+        journal = BoardJournal(self.path)
+        board, _ = journal.load()
+        journal.close()
+        self.assertEqual(self.titles(board), ["Un", "Deux", "Trois"])
+        self.assertEqual(journal.seq, 3)
+    
+    def test_complete_line_without_newline_is_dropped(self):
+        journal = BoardJournal(self.path)
+        board, _ = journal.load()
+        self.record_card(journal, board, "Un")
+        journal.close()
+        with open(journal.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"op": "delete_card", "id": "x", "seq": 2}')
+        
+        journal = BoardJournal(self.path)
+        board, _ = journal.load()
+        self.record_card(journal, board, "Deux")
+        journal.close()
+        
+        board, _ = BoardJournal(self.path).load()
+        self.assertEqual(self.titles(board), ["Un", "Deux"])
+
+if __name__ == "__main__":
+    unittest.main()
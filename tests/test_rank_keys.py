@@ -0,0 +1,142 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board_model import BoardModel, KanbanCard, KanbanColumn
+from rank_keys import key_between, keys_between
+
+class KeyBetweenTest(unittest.TestCase):
+    def test_repeated_inserts_at_the_front(self):
+        keys = [key_between(None, None)]
+        for _ in range(5000):
+            keys.insert(0, key_between(None, keys[0]))
+        self.assertEqual(keys, sorted(set(keys)))
+    
+    def test_repeated_inserts_at_the_back(self):
+        keys = [key_between(None, None)]
+        for _ in range(5000):
+            keys.append(key_between(keys[-1], None))
+        self.assertEqual(keys, sorted(set(keys)))
+        # Ajouter en fin reste court: la partie entière absorbe les ajouts
+        self.assertLessEqual(max(map(len, keys)), 4)
+    
+    def test_repeated_inserts_between_adjacent_keys(self):
+        low = key_between(None, None)
+        high = key_between(low, None)
+        for _ in range(500):
+            middle = key_between(low, high)
+            self.assertLess(low, middle)
+            self.assertLess(middle, high)
+            low = middle
+        for _ in range(500):
+            middle = key_between(low, high)
+            self.assertLess(low, middle)
+            self.assertLess(middle, high)
+            high = middle
+    
+    def test_random_inserts_keep_order(self):
+        rng = random.Random(7)
+        keys = []
+        for _ in range(3000):
+            position = rng.randint(0, len(keys))
+            before = keys[position - 1] if position else None
+            after = keys[position] if position < len(keys) else None
+            keys.insert(position, key_between(before, after))
+        self.assertEqual(keys, sorted(set(keys)))
+    
+    def test_unordered_bounds_are_rejected(self):
+        key = key_between(None, None)
+        with self.assertRaises(ValueError):
+            key_between(key, key)
+        with self.assertRaises(ValueError):
+            key_between(key_between(key, None), key)
+
+class KeysBetweenTest(unittest.TestCase):
+    def test_sorted_and_unique_within_bounds(self):
+        low = key_between(None, None)
+        high = key_between(low, None)
+        for a, b in ((None, None), (low, None), (None, low), (low, high)):
+            for count in (0, 1, 2, 7, 100, 1000):
+                with self.subTest(a=a, b=b, count=count):
+                    keys = keys_between(a, b, count)
+                    self.assertEqual(len(keys), count)
+                    self.assertEqual(keys, sorted(set(keys)))
+                    if keys and a is not None:
+                        self.assertLess(a, keys[0])
+                    if keys and b is not None:
+                        self.assertLess(keys[-1], b)
+
+class BoardRankTest(unittest.TestCase):
+    def ranks(self, column):
+        return [card.rank for card in column.cards]
+    
+    def test_pre_rank_board_is_renumbered(self):
+        column = KanbanColumn("📝 À faire")
+        column.cards = [KanbanCard(f"Carte {i}") for i in range(50)]
+        titles = [card.title for card in column.cards]
+        BoardModel([column])
+        
+        self.assertEqual([card.title for card in column.cards], titles)
+        self.assertEqual(self.ranks(column), sorted(set(self.ranks(column))))
+        self.assertNotIn(None, self.ranks(column))
+    
+    def test_inconsistent_ranks_are_renumbered(self):
+        column = KanbanColumn("📝 À faire")
+        column.cards = [KanbanCard("A", rank="a2"), KanbanCard("B", rank="a1"), KanbanCard("C", rank=None)]
+        BoardModel([column])
+        self.assertEqual([card.title for card in column.cards], ["A", "B", "C"])
+        self.assertEqual(self.ranks(column), sorted(set(self.ranks(column))))
+    
+    def test_ordered_ranks_are_kept(self):
+        column = KanbanColumn("📝 À faire")
+        column.cards = [KanbanCard(title, rank=rank) for title, rank in (("A", "a0"), ("B", "a0V"), ("C", "a1"))]
+        board = BoardModel()
+        self.assertFalse(board.rank_cards(column))
+        self.assertEqual(self.ranks(column), ["a0", "a0V", "a1"])
+    
+    def test_moves_keep_columns_sorted(self):
+        rng = random.Random(11)
+        board = BoardModel.default()
+        ids = []
+        for i in range(500):
+            card = KanbanCard(f"Carte {i}")
+            board.add_card(card, rng.choice(board.columns))
+            ids.append(card.id)
+        
+        for _ in range(2000):
+            card = board.get_card(rng.choice(ids))
+            column = rng.choice(board.columns)
+            others = [other for other in column.cards if other is not card]
+            if others and rng.random() < 0.8:
+                anchor = rng.choice(others)
+                before = rng.random() < 0.5
+                rank = board.ranks_beside(column, anchor, 1, before, skip={card.id})[0]
+                board.move_card(card.id, column, rank)
+                neighbour = column.cards.index(card) + (1 if before else -1)
+                self.assertIs(column.cards[neighbour], anchor)
+            elif board.column_of(card.id) is not column:
+                # Sans rang, un changement de colonne place la carte en fin
+                board.move_card(card.id, column)
+                self.assertIs(column.cards[-1], card)
+        
+        for column in board.columns:
+            self.assertEqual(self.ranks(column), sorted(set(self.ranks(column))))
+        self.assertEqual(sum(len(column.cards) for column in board.columns), len(ids))
+    
+    def test_remove_among_equal_ranks(self):
+        board = BoardModel.default()
+        column = board.columns[1]
+        cards = [KanbanCard(f"Carte {i}") for i in range(4)]
+        for card in cards:
+            board.add_card(card, column)
+        for card in cards[1:3]:
+            card.rank = cards[0].rank
+        board.delete_card(cards[2].id)
+        self.assertEqual([card.title for card in column.cards], ["Carte 0", "Carte 1", "Carte 3"])
+        self.assertNotIn(cards[2].id, board)
+
+if __name__ == "__main__":
+    unittest.main()
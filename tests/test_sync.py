@@ -0,0 +1,156 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board_model import BoardModel, KanbanCard
+from persistence import board_from_dict
+from sync_client import OP_ERRORS, SyncClient, SyncSession
+from sync_server import SyncServer, SyncState
+
+class Peer:
+    # Même réconciliation que l'application, sur un BoardModel sans interface
+    def __init__(self, url):
+        self.client = SyncClient(url)
+        self.session = SyncSession(self.client)
+        self.board = self.session.adopt(self.client.fetch_board())
+        self.rejected = []
+        self.client.start()
+    
+    def send(self, op):
+        self.board.apply(op)
+        self.session.send(op)
+    
+    def drain(self):
+        while True:
+            event = self.client.poll()
+            if event is None:
+                break
+            kind, payload = event
+            if kind == 'ops':
+                for op in self.session.accept(*payload):
+                    try:
+                        self.board.apply(op)
+                    except OP_ERRORS:
+                        self.session.conflict = True
+            elif kind == 'rejected':
+                self.rejected.append(payload)
+                self.session.rejected(payload[0])
+            elif kind == 'reset':
+                self.board = self.session.adopt(payload)
+        self.session.resolve()
+    
+    def settled(self, version):
+        return (self.session.version >= version and not self.session.pending and not self.session.conflict
+                and not self.client.resetting.is_set())
+
+def layout(board):
+    return [[(card.id, card.title, card.rank) for card in column.cards] for column in board.columns]
+
+class SyncTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(SyncClient, 'WAIT', 0.5)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.state = SyncState(BoardModel.default(), capacity=100)
+        self.server = SyncServer(('127.0.0.1', 0), self.state)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.peers = [Peer(self.server.url), Peer(self.server.url)]
+    
+    def tearDown(self):
+        for peer in self.peers:
+            peer.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def settle(self, version, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for peer in self.peers:
+                peer.drain()
+            if self.state.version >= version and all(peer.settled(self.state.version) for peer in self.peers):
+                return
+            time.sleep(0.02)
+        self.fail(f"version {version} non atteinte")
+    
+    def test_deltas_converge(self):
+        a, b = self.peers
+        card = KanbanCard("Migration").to_dict()
+        a.send({'op': 'add_card', 'column': 0, 'card': card})
+        self.settle(1)
+        self.assertIn(card['id'], b.board)
+        
+        b.send({'op': 'move_card', 'id': card['id'], 'to': 2})
+        a.send({'op': 'add_card', 'column': 2, 'card': KanbanCard("Cache").to_dict()})
+        self.settle(3)
+        b.send({'op': 'update_card', 'id': card['id'], 'fields': {'title': "Migration v2"}})
+        a.send({'op': 'move_column', 'from': 1, 'to': 3})
+        self.settle(5)
+        
+        self.assertEqual(layout(a.board), layout(self.state.board))
+        self.assertEqual(layout(b.board), layout(self.state.board))
+        self.assertEqual(self.state.board.get_card(card['id']).title, "Migration v2")
+    
+    def test_refused_op_is_reported(self):
+        a, b = self.peers
+        card = KanbanCard("Obsolète").to_dict()
+        a.send({'op': 'add_card', 'column': 0, 'card': card})
+        self.settle(1)
+        b.send({'op': 'delete_card', 'id': card['id']})
+        self.settle(2)
+        
+        a.session.send({'op': 'update_card', 'id': card['id'], 'fields': {'title': "Trop tard"}})
+        self.settle(2)
+        self.assertEqual(len(a.rejected), 1)
+        self.assertEqual(self.state.version, 2)
+        self.assertNotIn(card['id'], a.board)
+    
+    def test_partial_batch_keeps_valid_ops(self):
+        a, b = self.peers
+        card = KanbanCard("Lot").to_dict()
+        a.send({'op': 'add_card', 'column': 0, 'card': card})
+        self.settle(1)
+        b.client.send({'op': 'batch', 'ops': [{'op': 'delete_card', 'id': "inconnue"},
+                                              {'op': 'move_card', 'id': card['id'], 'to': 1}]})
+        self.settle(2)
+        
+        entry = self.state.log[-1]
+        self.assertTrue(entry['partial'])
+        self.assertEqual(len(entry['op']['ops']), 1)
+        self.assertIs(a.board.column_of(card['id']), a.board.columns[1])
+    
+    def test_lagging_client_reloads_snapshot(self):
+        a, b = self.peers
+        self.state.log = type(self.state.log)(maxlen=2)
+        card = KanbanCard("Retard").to_dict()
+        a.send({'op': 'add_card', 'column': 0, 'card': card})
+        for i in range(4):
+            a.send({'op': 'update_card', 'id': card['id'], 'fields': {'title': f"Retard {i}"}})
+        self.settle(5)
+        
+        # Client resté à la version 0: le journal du serveur ne remonte plus jusque-là
+        late = SyncClient(self.server.url)
+        late.fetch_board()
+        late.version = 0
+        late.start()
+        try:
+            deadline = time.monotonic() + 5.0
+            event = None
+            while time.monotonic() < deadline:
+                event = late.poll()
+                if event is not None and event[0] == 'reset':
+                    break
+                time.sleep(0.02)
+            self.assertEqual(event[0], 'reset')
+            board, _ = board_from_dict(event[1]['board'])
+            self.assertEqual(board.get_card(card['id']).title, "Retard 3")
+            self.assertEqual(event[1]['version'], 5)
+        finally:
+            late.close()
+
+if __name__ == "__main__":
+    unittest.main()